@@ -6,6 +6,18 @@ import tempfile
 import datetime
 import json
 import locale
+import threading
+import subprocess
+import heapq
+import sqlite3
+import hashlib
+import uuid
+import re
+import bisect
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
@@ -13,35 +25,292 @@ from PyQt5.QtWidgets import (
     QAction, QTableWidget, QTableWidgetItem, QHeaderView,
     QSplitter, QAbstractItemView, QInputDialog, QMessageBox,
     QMenu, QListWidget, QListWidgetItem, QDialog, QTextEdit, QLineEdit,
-    QScrollArea
+    QScrollArea, QProgressBar, QListView
+)
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QFontDatabase, QFont, QColor, QPalette, QIcon, QPainter, QTransform
+from PyQt5.QtCore import (
+    Qt, QPropertyAnimation, QVariantAnimation, QAbstractAnimation, QRect, QRectF, QSize, QTimer, QElapsedTimer, QPoint, QTranslator,
+    QObject, QRunnable, QThreadPool, QFileSystemWatcher, QBuffer, QIODevice,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel, pyqtSignal, pyqtSlot
 )
-from PyQt5.QtGui import QPixmap, QFontDatabase, QFont, QColor, QPalette, QIcon, QPainter, QTransform
-from PyQt5.QtCore import Qt, QPropertyAnimation, QRect, QSize, QTimer, QPoint, QTranslator
 
 from PIL import Image
 
 # WinRAR yolunu ayarla
 rarfile.UNRAR_TOOL = r"C:\Program Files\WinRAR\UnRAR.exe"
 
+NATURAL_SPLIT = re.compile(r"(\d+)")
+
+def natural_sort_key(text):
+    """Metindeki sayıları sayı olarak karşılaştıran sıralama anahtarı (page2 < page10)"""
+    parts = NATURAL_SPLIT.split(text)
+    parts[1::2] = [int(part) for part in parts[1::2]]
+    parts[0::2] = [part.casefold() for part in parts[0::2]]
+    return parts
+
+def content_cache_path(cache_dir, file_path, extension, *parts):
+    """Yol, değişiklik zamanı, boyut ve ek parçalardan üretilen önbellek dosyası"""
+    stat = os.stat(file_path)
+    key = "|".join([os.path.abspath(file_path), str(stat.st_mtime_ns), str(stat.st_size)] + [str(part) for part in parts])
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, digest[:2], digest + extension)
+
+class ZipPageSource:
+    """CBZ arşivindeki sayfaları istek üzerine belleğe açar"""
+    LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+    def __init__(self, file_path, use_mmap=True):
+        self.file_path = file_path
+        # Açılışta yalnızca merkezi dizin okunur, sayfalar diske çıkarılmaz
+        self.archive = zipfile.ZipFile(file_path, 'r')
+        self.lock = threading.Lock()
+        self.members = {}
+        for info in self.archive.infolist():
+            if info.is_dir():
+                continue
+            if os.path.splitext(info.filename)[1].lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
+                self.members[os.path.join(file_path, info.filename)] = info
+        self.pages = sorted(self.members, key=natural_sort_key)
+
+        # Arşivi belleğe eşle; sayfalar işletim sisteminin sayfa önbelleğinden okunur
+        self.mapping = None
+        self.offsets = {}
+        if use_mmap:
+            try:
+                with open(file_path, 'rb') as f:
+                    self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                print(f"Bellek eşleme hatası ({file_path}): {e}")
+
+    def _data_offset(self, info):
+        """Üyenin yerel başlığını çözüp sıkıştırılmış verinin başlangıcını döndürür"""
+        offset = self.offsets.get(info.filename)
+        if offset is None:
+            header = self.LOCAL_HEADER.unpack_from(self.mapping, info.header_offset)
+            if header[0] != b"PK\x03\x04":
+                raise zipfile.BadZipFile(f"Bozuk yerel başlık: {info.filename}")
+            offset = info.header_offset + self.LOCAL_HEADER.size + header[10] + header[11]
+            self.offsets[info.filename] = offset
+        return offset
+
+    def _read_mapped(self, info):
+        """Saklanan üyeyi kopyasız memoryview, sıkıştırılmışı eşlemeden açarak döndürür"""
+        if info.flag_bits & 0x1:
+            return None  # Şifreli üyeler zipfile ile okunur
+        start = self._data_offset(info)
+        view = memoryview(self.mapping)[start:start + info.compress_size]
+        if info.compress_type == zipfile.ZIP_STORED:
+            return view
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            return zlib.decompress(view, -15)
+        return None
+
+    def read_page(self, page_path):
+        """Tek bir sayfayı arşivden belleğe açar"""
+        info = self.members.get(page_path)
+        if info is None:
+            return None
+        if self.mapping is not None:
+            try:
+                data = self._read_mapped(info)
+                if data is not None:
+                    return data
+            except (zipfile.BadZipFile, struct.error, zlib.error, ValueError) as e:
+                print(f"Eşlenmiş okuma hatası ({page_path}): {e}")
+        with self.lock:
+            return self.archive.read(info)
+
+    def read_header(self, page_path, size):
+        """Sayfanın yalnızca ilk baytlarını açar; boyut ve biçim için yeterlidir"""
+        info = self.members.get(page_path)
+        if info is None:
+            return None
+        if self.mapping is not None and not info.flag_bits & 0x1:
+            try:
+                start = self._data_offset(info)
+                view = memoryview(self.mapping)[start:start + info.compress_size]
+                if info.compress_type == zipfile.ZIP_STORED:
+                    return view[:size]
+                if info.compress_type == zipfile.ZIP_DEFLATED:
+                    return zlib.decompressobj(-15).decompress(view, size)
+            except (zipfile.BadZipFile, struct.error, zlib.error, ValueError) as e:
+                print(f"Eşlenmiş okuma hatası ({page_path}): {e}")
+        with self.lock:
+            with self.archive.open(info) as f:
+                return f.read(size)
+
+    def read_headers(self, size):
+        for page_path in self.pages:
+            yield page_path, self.read_header(page_path, size)
+
+    def close(self):
+        with self.lock:
+            self.archive.close()
+            if self.mapping is not None:
+                try:
+                    self.mapping.close()
+                except BufferError:
+                    pass  # Dışarıda kalan görünümler bitince eşleme kendiliğinden kapanır
+                self.mapping = None
+
+class RarPageSource:
+    """CBR arşivindeki sayfaları istek üzerine açar"""
+    def __init__(self, file_path, window_size=8):
+        self.file_path = file_path
+        # Üye listesi bir kez okunur, sayfalar diske çıkarılmaz
+        self.archive = rarfile.RarFile(file_path, 'r')
+        self.lock = threading.Lock()
+        self.infos = [info for info in self.archive.infolist() if not info.is_dir()]
+        # Katı arşiv: üyelerden biri önceki üyelerin sözlüğüne bağlıysa (RAR3 ve RAR5'te aynı bayrak)
+        self.solid = any(info.flags & rarfile.RAR_FILE_SOLID for info in self.infos)
+        self.keys = [os.path.join(file_path, info.filename) for info in self.infos]
+        self.members = {}
+        self.order = {}
+        for index, (key, info) in enumerate(zip(self.keys, self.infos)):
+            if os.path.splitext(info.filename)[1].lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
+                self.members[key] = info
+                self.order[key] = index
+        self.pages = sorted(self.members, key=natural_sort_key)
+
+        # Katı (solid) arşivler için sıralı akış ve çözülmüş sayfa penceresi
+        self.window_size = window_size
+        self.window = OrderedDict()
+        self.stream = None
+        self.stream_pos = 0
+        self.closed = False
+
+    def read_page(self, page_path):
+        """Tek bir sayfayı arşivden belleğe açar; kapatılmış kaynakta None döndürür"""
+        info = self.members.get(page_path)
+        if info is None or self.closed:
+            return None
+        with self.lock:
+            if self.closed:
+                return None
+            if not self.solid:
+                return self.archive.read(info)
+            try:
+                return self._read_solid(page_path)
+            except Exception as e:
+                if self.closed:
+                    return None  # Kapatılırken UnRAR süreci sonlandırıldı
+                print(f"RAR akış hatası: {e}")
+                self._stop_stream()
+                return self.archive.read(info)
+            finally:
+                if self.closed:
+                    self._release()
+
+    def read_headers(self, size):
+        """Sayfaların baş kısımlarını arşiv sırasıyla döndürür; katı arşiv tek geçişte okunur"""
+        for page_path in sorted(self.members, key=self.order.get):
+            if self.solid:
+                data = self.read_page(page_path)
+                yield page_path, data[:size] if data else data
+            else:
+                with self.lock:
+                    if self.closed:
+                        return
+                    with self.archive.open(self.members[page_path]) as f:
+                        data = f.read(size)
+                yield page_path, data
+
+    def _read_solid(self, page_path):
+        """Katı arşivde sayfayı tek bir UnRAR sürecinden sırayla okur"""
+        if page_path in self.window:
+            self.window.move_to_end(page_path)
+            return self.window[page_path]
+
+        target = self.order[page_path]
+        # Geride kalan bir sayfa için akışı baştan başlat
+        if self.stream is None or target < self.stream_pos:
+            self._start_stream()
+
+        while self.stream_pos <= target:
+            if self.closed:
+                raise EOFError("Arşiv kapatıldı")
+            info = self.infos[self.stream_pos]
+            data = self._read_exact(info.file_size)
+            key = self.keys[self.stream_pos]
+            self.stream_pos += 1
+            if key in self.members:
+                self.window[key] = data
+                while len(self.window) > self.window_size:
+                    self.window.popitem(last=False)
+
+        return self.window.get(page_path)
+
+    def _start_stream(self):
+        self._stop_stream()
+        creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        self.stream = subprocess.Popen(
+            [rarfile.UNRAR_TOOL, 'p', '-inul', '-y', self.file_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=creationflags
+        )
+        self.stream_pos = 0
+
+    def _stop_stream(self):
+        if self.stream:
+            try:
+                self.stream.kill()
+                self.stream.wait()
+                self.stream.stdout.close()
+            except Exception as e:
+                print(f"UnRAR süreci kapatma hatası: {e}")
+            finally:
+                self.stream = None
+                self.stream_pos = 0
+
+    def _read_exact(self, size):
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = self.stream.stdout.read(remaining)
+            if not chunk:
+                raise EOFError("UnRAR akışı beklenenden erken bitti")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def _release(self):
+        self._stop_stream()
+        self.window.clear()
+
+    def close(self):
+        """Kaynağı kapatır; süren akış okumasını beklemez (GUI iş parçacığını dondurmaz)"""
+        self.closed = True
+        stream = self.stream
+        if stream:
+            try:
+                # Okuyan iş parçacığı akışın sonuna ulaşır, kaynakları kendisi bırakır
+                stream.kill()
+            except Exception as e:
+                print(f"UnRAR süreci kapatma hatası: {e}")
+        if self.lock.acquire(blocking=False):
+            try:
+                self._release()
+            finally:
+                self.lock.release()
+        self.archive.close()
+
 class FileManager:
     def __init__(self):
-        self.temp_dir = None
+        self.page_source = None
         self.current_folder = os.path.expanduser("~")
         self.supported_extensions = ['.cbz', '.cbr', '.jpg', '.jpeg', '.png', '.bmp', '.gif']
+        self.directory_listings = {}  # klasör -> (mtime_ns, dosyalar, ad -> sıra)
 
-    def cleanup_temp(self):
-        """Geçici dosyaları temizler"""
-        if self.temp_dir and os.path.exists(self.temp_dir):
+    def close_page_source(self):
+        """Açık arşivi kapatır"""
+        if self.page_source:
             try:
-                for file in os.listdir(self.temp_dir):
-                    file_path = os.path.join(self.temp_dir, file)
-                    if os.path.isfile(file_path):
-                        os.remove(file_path)
-                os.rmdir(self.temp_dir)
+                self.page_source.close()
             except Exception as e:
-                print(f"Geçici dosya temizleme hatası: {e}")
+                print(f"Arşiv kapatma hatası: {e}")
             finally:
-                self.temp_dir = None
+                self.page_source = None
 
     def get_file_size_str(self, size_bytes):
         """Dosya boyutunu okunabilir formata çevirir"""
@@ -68,45 +337,44 @@ class FileManager:
         else:
             return "Dosya"
 
-    def open_file(self, file_path):
-        """Dosyayı açar ve sayfaları döndürür"""
+    @staticmethod
+    def create_page_source(file_path):
+        """Arşiv için uygun sayfa kaynağını oluşturur, arşiv değilse None döndürür"""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.cbz':
+            return ZipPageSource(file_path)
+        elif ext == '.cbr':
+            return RarPageSource(file_path)
+        return None
+
+    def open_file(self, file_path, page_source=None):
+        """Dosyayı açar ve sayfaları döndürür; önceden açılmış kaynak verilirse onu kullanır"""
         if not file_path or not os.path.exists(file_path):
-            return None, []
+            if page_source:
+                page_source.close()  # Kullanılmayan önden açılmış kaynak sızdırılmaz
+            return []
 
-        self.cleanup_temp()
+        self.close_page_source()
         ext = os.path.splitext(file_path)[1].lower()
-        self.temp_dir = tempfile.mkdtemp()
         pages = []
 
         try:
-            if ext == '.cbz':
-                with zipfile.ZipFile(file_path, 'r') as zf:
-                    zf.extractall(self.temp_dir)
-                    pages = self._get_image_files(self.temp_dir)
-            elif ext == '.cbr':
-                with rarfile.RarFile(file_path, 'r') as rf:
-                    rf.extractall(self.temp_dir)
-                    pages = self._get_image_files(self.temp_dir)
-            elif ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
-                pages = [file_path]
-                self.temp_dir = None
+            if ext in ['.cbz', '.cbr']:
+                self.page_source = page_source or self.create_page_source(file_path)
+                pages = self.page_source.pages
             else:
-                return None, []
+                if page_source:
+                    page_source.close()
+                if ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
+                    pages = [file_path]
+                else:
+                    return []
 
-            return self.temp_dir, sorted(pages)
+            return list(pages)
         except Exception as e:
             print(f"Dosya açma hatası: {e}")
-            self.cleanup_temp()
-            return None, []
-
-    def _get_image_files(self, directory):
-        """Klasördeki resim dosyalarını bulur"""
-        image_files = []
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if os.path.splitext(file)[1].lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
-                    image_files.append(os.path.join(root, file))
-        return image_files
+            self.close_page_source()
+            return []
 
     def save_json(self, data, filename):
         """JSON dosyasını kaydeder"""
@@ -128,24 +396,34 @@ class FileManager:
             print(f"JSON yükleme hatası: {e}")
         return {}
 
+    def get_directory_listing(self, directory):
+        """Klasörün doğal sıralı listesini ve ad -> sıra dizinini döndürür; klasör değişmedikçe önbellekten"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return [], {}
+        cached = self.directory_listings.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        files = sorted([
+            f for f in os.listdir(directory)
+            if os.path.splitext(f)[1].lower() in self.supported_extensions
+        ], key=natural_sort_key)
+        positions = {name: index for index, name in enumerate(files)}
+        self.directory_listings[directory] = (mtime, files, positions)
+        return files, positions
+
     def get_next_file_in_directory(self, current_file):
         """Klasördeki sonraki dosyayı bulur"""
         if not current_file:
             return None
 
         directory = os.path.dirname(current_file)
-        files = sorted([
-            f for f in os.listdir(directory)
-            if os.path.splitext(f)[1].lower() in self.supported_extensions
-        ])
-        
-        try:
-            current_index = files.index(os.path.basename(current_file))
-            if current_index < len(files) - 1:
-                return os.path.join(directory, files[current_index + 1])
-        except ValueError:
-            pass
-        
+        files, positions = self.get_directory_listing(directory)
+        current_index = positions.get(os.path.basename(current_file))
+        if current_index is not None and current_index < len(files) - 1:
+            return os.path.join(directory, files[current_index + 1])
         return None
 
     def save_screenshot(self, pixmap, directory="screenshots"):
@@ -164,23 +442,550 @@ class FileManager:
             print(f"Ekran görüntüsü kaydetme hatası: {e}")
             return None
 
-class ComicLibrary:
+class SQLiteLibraryStore:
+    """Kütüphaneyi satır bazında güncellenen bir SQLite veritabanında tutar"""
+    BOOK_COLUMNS = ('path', 'name', 'last_page', 'last_read_date', 'favorite')
+    FAVORITE_COLUMNS = ('filepath', 'source_file', 'page_number', 'date', 'title')
+    NOTE_COLUMNS = ('title', 'content', 'source_file', 'page_number', 'date')
+
+    def __init__(self, db_file="library.db"):
+        self.db_file = db_file
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.create_schema()
+
+    def create_schema(self):
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS series (
+                    name TEXT PRIMARY KEY,
+                    folder TEXT NOT NULL,
+                    last_read TEXT,
+                    position INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS books (
+                    id INTEGER PRIMARY KEY,
+                    series TEXT NOT NULL REFERENCES series(name) ON DELETE CASCADE,
+                    path TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    last_page INTEGER NOT NULL DEFAULT 0,
+                    last_read_date TEXT,
+                    favorite INTEGER NOT NULL DEFAULT 0,
+                    extra TEXT,
+                    position INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS books_path ON books(path);
+                CREATE INDEX IF NOT EXISTS books_series ON books(series, position);
+                CREATE INDEX IF NOT EXISTS books_last_read ON books(last_read_date);
+                CREATE TABLE IF NOT EXISTS favorites (
+                    id INTEGER PRIMARY KEY,
+                    filepath TEXT,
+                    source_file TEXT,
+                    page_number INTEGER,
+                    date TEXT,
+                    title TEXT,
+                    tags TEXT
+                );
+                CREATE TABLE IF NOT EXISTS notes (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT,
+                    content TEXT,
+                    source_file TEXT,
+                    page_number INTEGER,
+                    date TEXT
+                );
+                CREATE INDEX IF NOT EXISTS notes_source ON notes(source_file);
+            """)
+
+    def get_meta(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _book_row(self, series_name, book, position):
+        # Bilinen alanlar sütunlara, geri kalanlar JSON olarak 'extra' sütununa yazılır
+        extra = {k: v for k, v in book.items() if k not in self.BOOK_COLUMNS}
+        return (
+            series_name, book['path'], book['name'], book.get('last_page', 0),
+            book.get('last_read_date'), int(bool(book.get('favorite', False))),
+            json.dumps(extra, ensure_ascii=False) if extra else None, position
+        )
+
+    def load_series(self):
+        """Kütüphaneyi JSON dosyasıyla aynı yapıda sözlük olarak yükler"""
+        series = {}
+        with self.lock:
+            for name, folder, last_read in self.conn.execute(
+                    "SELECT name, folder, last_read FROM series ORDER BY position"):
+                series[name] = {'folder': folder, 'last_read': last_read, 'books': []}
+            rows = self.conn.execute(
+                "SELECT series, path, name, last_page, last_read_date, favorite, extra "
+                "FROM books ORDER BY series, position"
+            ).fetchall()
+        for series_name, path, name, last_page, last_read_date, favorite, extra in rows:
+            book = {
+                'path': path,
+                'name': name,
+                'last_page': last_page,
+                'last_read_date': last_read_date
+            }
+            if favorite:
+                book['favorite'] = True
+            if extra:
+                book.update(json.loads(extra))
+            if series_name in series:
+                series[series_name]['books'].append(book)
+        return series
+
+    def _upsert_series(self, name, series, position):
+        self.conn.execute(
+            "INSERT INTO series (name, folder, last_read, position) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET folder = excluded.folder, last_read = excluded.last_read",
+            (name, series['folder'], series.get('last_read'), position)
+        )
+
+    def _replace_books(self, series_name, books):
+        self.conn.execute("DELETE FROM books WHERE series = ?", (series_name,))
+        self.conn.executemany(
+            "INSERT INTO books (series, path, name, last_page, last_read_date, favorite, extra, position) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [self._book_row(series_name, book, i) for i, book in enumerate(books)]
+        )
+
+    def save_series(self, name, series, position=0):
+        with self.lock, self.conn:
+            self._upsert_series(name, series, position)
+
+    def replace_series_books(self, series_name, books):
+        with self.lock, self.conn:
+            self._replace_books(series_name, books)
+
+    def save_book(self, series_name, book):
+        with self.lock, self.conn:
+            row = self._book_row(series_name, book, 0)
+            self.conn.execute(
+                "UPDATE books SET name = ?, last_page = ?, last_read_date = ?, favorite = ?, extra = ? "
+                "WHERE series = ? AND path = ?",
+                row[2:7] + (series_name, book['path'])
+            )
+
+    def update_progress(self, series_name, book):
+        """Okuma ilerlemesini tek satırda günceller"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE books SET last_page = ?, last_read_date = ? WHERE series = ? AND path = ?",
+                (book['last_page'], book['last_read_date'], series_name, book['path'])
+            )
+            self.conn.execute(
+                "UPDATE series SET last_read = ? WHERE name = ?", (book['path'], series_name)
+            )
+
+    def _save_all(self, series):
+        names = list(series)
+        placeholders = ",".join("?" * len(names))
+        self.conn.execute(f"DELETE FROM series WHERE name NOT IN ({placeholders})", names)
+        for position, name in enumerate(names):
+            self._upsert_series(name, series[name], position)
+            self._replace_books(name, series[name]['books'])
+
+    def save_all(self, series):
+        """Tüm kütüphaneyi tek işlemde eşitler"""
+        with self.lock, self.conn:
+            self._save_all(series)
+
+    def load_favorites(self):
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT id, filepath, source_file, page_number, date, title, tags FROM favorites ORDER BY id"
+            ).fetchall()
+        favorites = []
+        for row in rows:
+            fav = dict(zip(('id',) + self.FAVORITE_COLUMNS, row[:6]))
+            fav['tags'] = json.loads(row[6]) if row[6] else []
+            favorites.append(fav)
+        return favorites
+
+    def _favorite_row(self, fav):
+        return tuple(fav.get(c) for c in self.FAVORITE_COLUMNS) + (
+            json.dumps(fav.get('tags', []), ensure_ascii=False),
+        )
+
+    def _insert_favorite(self, fav):
+        cursor = self.conn.execute(
+            "INSERT INTO favorites (filepath, source_file, page_number, date, title, tags) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            self._favorite_row(fav)
+        )
+        fav['id'] = cursor.lastrowid
+
+    def add_favorite(self, fav):
+        with self.lock, self.conn:
+            self._insert_favorite(fav)
+
+    def update_favorite(self, fav):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE favorites SET filepath = ?, source_file = ?, page_number = ?, date = ?, title = ?, tags = ? "
+                "WHERE id = ?",
+                self._favorite_row(fav) + (fav['id'],)
+            )
+
+    def remove_favorite(self, fav):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM favorites WHERE id = ?", (fav['id'],))
+
+    def load_notes(self):
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT id, title, content, source_file, page_number, date FROM notes ORDER BY id"
+            ).fetchall()
+        return {"notes": [dict(zip(('id',) + self.NOTE_COLUMNS, row)) for row in rows]}
+
+    def _insert_note(self, note):
+        cursor = self.conn.execute(
+            "INSERT INTO notes (title, content, source_file, page_number, date) VALUES (?, ?, ?, ?, ?)",
+            tuple(note.get(c) for c in self.NOTE_COLUMNS)
+        )
+        note['id'] = cursor.lastrowid
+
+    def add_note(self, note):
+        with self.lock, self.conn:
+            self._insert_note(note)
+
+    def update_note(self, note):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE notes SET title = ?, content = ?, source_file = ?, page_number = ?, date = ? WHERE id = ?",
+                tuple(note.get(c) for c in self.NOTE_COLUMNS) + (note['id'],)
+            )
+
+    def remove_note(self, note):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM notes WHERE id = ?", (note['id'],))
+
+    def import_json(self, series, favorites, notes):
+        """Mevcut JSON dosyalarındaki verileri bir kez veritabanına aktarır"""
+        if self.get_meta("json_imported"):
+            return False
+        with self.lock, self.conn:
+            self._save_all(series)
+            for fav in favorites:
+                self._insert_favorite(fav)
+            for note in notes.get("notes", []):
+                self._insert_note(note)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                ("json_imported", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+        return True
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class SearchIndex:
+    """Seri, kitap, favori etiketi ve notlar için bellek içi ters dizin"""
+    TOKEN_PATTERN = re.compile(r"\w+")
+
     def __init__(self):
+        self.lock = threading.Lock()
+        self.postings = {}   # terim -> belge anahtarları
+        self.terms = []      # önek araması için sıralı terimler
+        self.documents = {}  # belge anahtarı -> (terimler, değer)
+
+    @staticmethod
+    def fold(text):
+        """Türkçe harf katlama; I/İ/ı/i aramada aynı harf sayılır"""
+        return text.replace("İ", "i").replace("I", "i").replace("ı", "i").casefold()
+
+    @classmethod
+    def tokenize(cls, text):
+        return cls.TOKEN_PATTERN.findall(cls.fold(text or ""))
+
+    def add(self, key, text, value=None):
+        """Belgeyi dizine ekler; aynı anahtar varsa yerine geçer"""
+        terms = set(self.tokenize(text))
+        with self.lock:
+            self._remove(key)
+            self.documents[key] = (terms, value)
+            for term in terms:
+                keys = self.postings.get(term)
+                if keys is None:
+                    keys = self.postings[term] = set()
+                    bisect.insort(self.terms, term)
+                keys.add(key)
+
+    def remove(self, key):
+        with self.lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+        for term in document[0]:
+            keys = self.postings[term]
+            keys.discard(key)
+            if not keys:
+                del self.postings[term]
+                del self.terms[bisect.bisect_left(self.terms, term)]
+
+    def clear(self, kinds):
+        """Verilen türlerdeki tüm belgeleri çıkarır"""
+        with self.lock:
+            for key in [key for key in self.documents if key[0] in kinds]:
+                self._remove(key)
+
+    def _prefix_matches(self, prefix):
+        keys = set()
+        i = bisect.bisect_left(self.terms, prefix)
+        while i < len(self.terms) and self.terms[i].startswith(prefix):
+            keys |= self.postings[self.terms[i]]
+            i += 1
+        return keys
+
+    def search(self, text, kinds=None):
+        """Her sözcüğü önek olarak arar, tümünü içeren belgeleri {anahtar: değer} döndürür"""
+        terms = self.tokenize(text)
+        if not terms:
+            return {}
+        with self.lock:
+            matches = None
+            # En seçici terimden başlayarak kesişim al
+            for keys in sorted((self._prefix_matches(term) for term in set(terms)), key=len):
+                matches = keys if matches is None else matches & keys
+                if not matches:
+                    return {}
+            return {key: self.documents[key][1] for key in matches
+                    if kinds is None or key[0] in kinds}
+
+class LibraryWriteTask(QRunnable):
+    """GUI iş parçacığında serileştirilmiş kütüphaneyi arka planda atomik olarak yazar"""
+    def __init__(self, library, data):
+        super().__init__()
+        self.library = library
+        self.data = data
+
+    def run(self):
+        try:
+            self.library._write_atomic(self.data, self.library.library_file)
+        except Exception as e:
+            self.library.dirty = True  # Sonraki kaydetmede yeniden denenir
+            print(f"Kütüphane kaydetme hatası: {e}")
+
+class ComicLibrary:
+    def __init__(self, save_delay=2.0, store=None):
         self.library_file = "library.json"
+        self.favorites_file = "favorites.json"
+        self.notes_file = "notes.json"
+        self.store = store  # İsteğe bağlı SQLite deposu; yoksa JSON dosyaları kullanılır
+        self.save_delay = save_delay  # Okuma ilerlemesi için toplu yazma aralığı (sn)
+        self.save_timer = QTimer()
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(int(save_delay * 1000))
+        self.save_timer.timeout.connect(self.flush)
+        self.writer = QThreadPool()
+        self.writer.setMaxThreadCount(1)  # Yazmalar sırayla diske ulaşır
+        self.dirty = False
         self.series = self.load_library()
+
+        # Yol -> (seri adı, kitap kaydı) dizini ve son okuma tarihine göre yığın
+        self.book_index = {}
+        self.last_read_heap = []
+        self.search_index = SearchIndex()
+        self.rebuild_index()
     
-    def load_library(self):
-        if os.path.exists(self.library_file):
+    def _load_json(self, filename, default):
+        if os.path.exists(filename):
             try:
-                with open(self.library_file, 'r', encoding='utf-8') as f:
+                with open(filename, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except:
-                return {}
-        return {}
+                return default
+        return default
+
+    def load_library(self):
+        if self.store:
+            # İlk açılışta JSON kütüphanesini veritabanına aktar
+            if self.store.import_json(
+                    self._load_json(self.library_file, {}),
+                    self._load_json(self.favorites_file, []),
+                    self._load_json(self.notes_file, {})):
+                print("JSON kütüphanesi SQLite veritabanına aktarıldı")
+            return self.store.load_series()
+        return self._load_json(self.library_file, {})
     
     def save_library(self):
-        with open(self.library_file, 'w', encoding='utf-8') as f:
-            json.dump(self.series, f, ensure_ascii=False, indent=4)
+        """Kütüphaneyi hemen serileştirir; JSON dosyası arka planda atomik olarak yazılır"""
+        self.save_timer.stop()
+        self.dirty = False
+        try:
+            if self.store:
+                self.store.save_all(self.series)
+            else:
+                # Sözlükler yalnızca GUI iş parçacığında değiştiği için burada serileştirilir
+                data = json.dumps(self.series, ensure_ascii=False, indent=4)
+                self.writer.start(LibraryWriteTask(self, data))
+        except Exception as e:
+            self.dirty = True
+            print(f"Kütüphane kaydetme hatası: {e}")
+
+    def save_book(self, file_path):
+        """Tek bir kitabın kaydını saklar"""
+        series_name, book = self.find_book(file_path)
+        if book is None:
+            return
+        if self.store:
+            self.store.save_book(series_name, book)
+        else:
+            self.save_library()
+
+    def _write_atomic(self, data, filename):
+        """Geçici dosyaya yazıp yeniden adlandırır; yarıda kalan yazma dosyayı bozmaz"""
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".library-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, filename)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _save_json(self, data, filename):
+        try:
+            self._write_atomic(json.dumps(data, ensure_ascii=False, indent=4), filename)
+        except Exception as e:
+            print(f"JSON kaydetme hatası: {e}")
+
+    def load_favorites(self):
+        if self.store:
+            favorites = self.store.load_favorites()
+        else:
+            favorites = self._load_json(self.favorites_file, [])
+        self.search_index.clear(("favorite",))
+        for fav in favorites:
+            self._index_favorite(fav)
+        return favorites
+
+    def _index_favorite(self, fav):
+        # Diyaloglardaki kayıtlar kopyadır; anahtar nesne kimliği değil ekran görüntüsü yoludur
+        self.search_index.add(("favorite", fav['filepath']), " ".join(fav.get('tags', [])), fav)
+
+    def save_favorites(self, favorites):
+        for fav in favorites:
+            self._index_favorite(fav)
+        if self.store:
+            for fav in favorites:
+                self.store.update_favorite(fav)
+        else:
+            self._save_json(favorites, self.favorites_file)
+
+    def add_favorite(self, favorites, fav):
+        favorites.append(fav)
+        self._index_favorite(fav)
+        if self.store:
+            self.store.add_favorite(fav)
+        else:
+            self._save_json(favorites, self.favorites_file)
+
+    def remove_favorite(self, favorites, fav):
+        for live in favorites:
+            if live['filepath'] == fav['filepath']:
+                favorites.remove(live)
+                break
+        self.search_index.remove(("favorite", fav['filepath']))
+        if self.store:
+            self.store.remove_favorite(fav)
+        else:
+            self._save_json(favorites, self.favorites_file)
+
+    def load_notes(self):
+        if self.store:
+            notes = self.store.load_notes()
+        else:
+            notes = self._load_json(self.notes_file, {})
+        self.search_index.clear(("note",))
+        for note in notes.get("notes", []):
+            # Eski JSON notlarına kalıcı kimlik verilir; bir sonraki kayıtta yazılır
+            note.setdefault('id', uuid.uuid4().hex)
+            self._index_note(note)
+        return notes
+
+    def _index_note(self, note):
+        self.search_index.add(("note", note['id']), f"{note['title']} {note['content']}", note)
+
+    @staticmethod
+    def _find_note(notes, note_id):
+        for note in notes.get("notes", []):
+            if note.get('id') == note_id:
+                return note
+        return None
+
+    def add_note(self, notes, note):
+        notes.setdefault("notes", []).append(note)
+        if self.store:
+            self.store.add_note(note)
+        else:
+            note.setdefault('id', uuid.uuid4().hex)
+            self._save_json(notes, self.notes_file)
+        self._index_note(note)
+
+    def update_note(self, notes, note):
+        """Düzenlenen kaydı (diyalogdan gelen kopya olabilir) listedeki nota uygular"""
+        live = self._find_note(notes, note['id'])
+        if live is None:
+            return
+        live.update(note)
+        self._index_note(live)
+        if self.store:
+            self.store.update_note(live)
+        else:
+            self._save_json(notes, self.notes_file)
+
+    def remove_note(self, notes, note):
+        live = self._find_note(notes, note['id'])
+        if live is not None:
+            notes["notes"].remove(live)
+        self.search_index.remove(("note", note['id']))
+        if self.store:
+            self.store.remove_note(note)
+        else:
+            self._save_json(notes, self.notes_file)
+
+    def schedule_save(self):
+        """Değişikliği bellekte tutar, yazmayı gecikmeli ve toplu yapar"""
+        self.dirty = True
+        if not self.save_timer.isActive():
+            self.save_timer.start()
+
+    def flush(self):
+        """Bekleyen değişiklikleri diske yazar"""
+        self.save_timer.stop()
+        if self.dirty:
+            self.save_library()
+
+    def close(self):
+        """Bekleyen yazmaları tamamlar ve depoyu kapatır"""
+        self.flush()
+        self.writer.waitForDone()
+        if self.store:
+            self.store.close()
+            self.store = None
     
     def add_series(self, name, folder_path):
         if name not in self.series:
@@ -189,129 +994,1432 @@ class ComicLibrary:
                 'last_read': None,
                 'books': []
             }
+            if self.store:
+                self.store.save_series(name, self.series[name], len(self.series) - 1)
+            self._index_series(name)
             self.update_series_books(name)
-            self.save_library()
+            if not self.store:
+                self.save_library()
     
+    def rebuild_index(self):
+        """Kitap dizinini ve son okunanlar yığınını baştan kurar"""
+        self.book_index = {}
+        self.last_read_heap = []
+        self.search_index.clear(("series", "book"))
+        for series_name in self.series:
+            self._index_series(series_name)
+
+    def _index_series(self, series_name):
+        self.search_index.add(("series", series_name), series_name, series_name)
+        for book in self.series[series_name]['books']:
+            self.book_index[book['path']] = (series_name, book)
+            self.search_index.add(("book", book['path']), book['name'], series_name)
+            self._push_last_read(book)
+
+    def _unindex_series(self, series_name):
+        self.search_index.remove(("series", series_name))
+        for book in self.series[series_name]['books']:
+            if self.book_index.get(book['path'], (None, None))[1] is book:
+                del self.book_index[book['path']]
+                self.search_index.remove(("book", book['path']))
+
+    def _push_last_read(self, book):
+        date = book.get('last_read_date')
+        if not date:
+            return
+        try:
+            timestamp = datetime.datetime.strptime(date, "%Y-%m-%d %H:%M:%S").timestamp()
+        except ValueError:
+            return
+        heapq.heappush(self.last_read_heap, (-timestamp, book['path'], date))
+        # Eskimiş girdiler birikirse yığını sıkıştır
+        if len(self.last_read_heap) > 2 * len(self.book_index) + 64:
+            current = {}
+            for entry in self.last_read_heap:
+                if self._is_current(entry):
+                    current[entry[1]] = entry
+            self.last_read_heap = list(current.values())
+            heapq.heapify(self.last_read_heap)
+
+    def _is_current(self, entry):
+        _, path, date = entry
+        _, book = self.book_index.get(path, (None, None))
+        return book is not None and book.get('last_read_date') == date
+
+    def find_book(self, file_path):
+        """Kitabı yoluna göre bulur, (seri adı, kitap) döndürür"""
+        return self.book_index.get(file_path, (None, None))
+
+    @staticmethod
+    def _norm(path):
+        return os.path.normcase(os.path.normpath(path))
+
+    def _is_within(self, path, directory):
+        return self._norm(path).startswith(os.path.join(self._norm(directory), ''))
+
+    def _list_directory(self, directory):
+        """Klasördeki çizgi roman dosyalarını ve alt klasörleri döndürür"""
+        files = []
+        subdirs = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in ['.cbz', '.cbr'] and entry.is_file():
+                    files.append(entry)
+        return files, subdirs
+
+    def _walk(self, folder):
+        """Klasörü alt klasörleriyle birlikte tarar, (dosyalar, klasörler) döndürür"""
+        entries = []
+        directories = []
+        stack = [folder]
+        while stack:
+            directory = stack.pop()
+            try:
+                files, subdirs = self._list_directory(directory)
+            except OSError as e:
+                print(f"Klasör okuma hatası ({directory}): {e}")
+                continue
+            directories.append(directory)
+            entries.extend(files)
+            stack.extend(subdirs)
+        return entries, directories
+
+    def walk_directories(self, folder):
+        """Seri klasörünü ve tüm alt klasörlerini döndürür"""
+        if not os.path.isdir(folder):
+            return []
+        return self._walk(folder)[1]
+
+    def _diff_books(self, folder, entries, existing):
+        """Dosyaları mevcut kayıtlarla karşılaştırır; eşleşmeyen kayıtlar 'existing' içinde kalır"""
+        # Kitaplar boyut ve değişiklik zamanı parmak iziyle karşılaştırılır,
+        # mevcut kayıtlar (son sayfa, favori vb.) olduğu gibi korunur.
+        # Tarama arka planda çalışabildiği için kayıtlar değiştirilmez; yeni
+        # parmak izleri ayrıca döndürülür ve apply_series_books'ta uygulanır
+        books = []
+        added = []
+        fingerprints = {}
+        changed = False
+        for entry in entries:
+            stat = entry.stat()
+            book = existing.pop(entry.path, None)
+            if book is None:
+                added.append((entry, stat))
+                continue
+            if book.get('mtime') != stat.st_mtime_ns or book.get('size') != stat.st_size:
+                # Dosya değişmiş: okuma durumu korunur, yalnızca parmak izi güncellenir
+                fingerprints[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                changed = True
+            books.append(book)
+
+        # Aynı parmak izine sahip silinmiş kayıt varsa dosya yeniden adlandırılmıştır
+        renamed = {
+            (book.get('mtime'), book.get('size')): path
+            for path, book in existing.items() if 'mtime' in book
+        }
+        for entry, stat in added:
+            book = {
+                'path': entry.path,
+                'name': os.path.relpath(entry.path, folder),
+                'last_page': 0,
+                'last_read_date': None,
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size
+            }
+            old_path = renamed.pop((stat.st_mtime_ns, stat.st_size), None)
+            if old_path:
+                old_book = dict(existing.pop(old_path))
+                for key, value in old_book.items():
+                    if key not in ('path', 'name'):
+                        book[key] = value
+            books.append(book)
+            changed = True
+
+        if existing:
+            changed = True
+        return books, changed, fingerprints
+
+    def scan_series_books(self, folder, old_books):
+        """Klasörü alt klasörleriyle tarar, (kitaplar, değişti_mi, parmak izleri) döndürür"""
+        existing = {book['path']: book for book in old_books}
+        entries = self._walk(folder)[0] if os.path.isdir(folder) else []
+        books, changed, fingerprints = self._diff_books(folder, entries, existing)
+        books.sort(key=lambda book: natural_sort_key(book['path']))
+
+        # Sıra değişikliği
+        if [book['path'] for book in books] != [book['path'] for book in old_books]:
+            changed = True
+        return books, changed, fingerprints
+
+    def series_for_directory(self, directory):
+        """Klasörü içeren serilerin adlarını döndürür"""
+        return [
+            name for name, series in self.series.items()
+            if self._norm(directory) == self._norm(series['folder'])
+            or self._is_within(directory, series['folder'])
+        ]
+
+    def update_directory(self, series_name, directory, known_directories):
+        """Tek bir klasördeki değişiklikleri seriye uygular, (değişti_mi, yeni klasörler) döndürür"""
+        series = self.series[series_name]
+        folder = series['folder']
+        old_books = series['books']
+
+        if not os.path.isdir(directory):
+            # Klasör silinmiş: altındaki tüm kitaplar çıkarılır
+            books = [book for book in old_books if not self._is_within(book['path'], directory)]
+            if len(books) == len(old_books):
+                return False, []
+            self.apply_series_books(series_name, books)
+            return True, []
+
+        files, subdirs = self._list_directory(directory)
+        subdir_set = {self._norm(d) for d in subdirs}
+        known = {self._norm(d) for d in known_directories}
+        new_subdirs = [d for d in subdirs if self._norm(d) not in known]
+
+        # Yalnızca bu klasördeki, yeni ve silinmiş alt klasörlerdeki kayıtlar
+        # karşılaştırılır; izlenen diğer alt klasörlere dokunulmaz
+        norm_directory = self._norm(directory)
+        rescanned = {self._norm(d) for d in new_subdirs}
+        existing = {}
+        kept = []
+        for book in old_books:
+            parent = self._norm(os.path.dirname(book['path']))
+            if parent == norm_directory:
+                existing[book['path']] = book
+            elif self._is_within(book['path'], directory):
+                top = os.path.join(norm_directory, os.path.relpath(parent, norm_directory).split(os.sep)[0])
+                if top not in subdir_set or top in rescanned:
+                    existing[book['path']] = book
+                else:
+                    kept.append(book)
+            else:
+                kept.append(book)
+
+        entries = list(files)
+        new_directories = []
+        for subdir in new_subdirs:
+            sub_entries, sub_directories = self._walk(subdir)
+            entries.extend(sub_entries)
+            new_directories.extend(sub_directories)
+
+        books, changed, fingerprints = self._diff_books(folder, entries, existing)
+        if not changed:
+            return False, new_directories
+
+        books = kept + books
+        books.sort(key=lambda book: natural_sort_key(book['path']))
+        self.apply_series_books(series_name, books, fingerprints)
+        return True, new_directories
+
+    def apply_series_books(self, series_name, books, fingerprints=None, persist=True):
+        """Taranan kitap listesini ve değişen parmak izlerini seriye uygular"""
+        for book in books:
+            if book['path'] in (fingerprints or {}):
+                book['mtime'], book['size'] = fingerprints[book['path']]
+        self._unindex_series(series_name)
+        self.series[series_name]['books'] = books
+        self._index_series(series_name)
+        if persist:
+            if self.store:
+                self.store.replace_series_books(series_name, books)
+            else:
+                self.save_library()
+
     def update_series_books(self, series_name):
+        """Seriyi yeniden tarar; yalnızca değişiklik varsa kaydeder"""
         if series_name in self.series:
-            folder = self.series[series_name]['folder']
-            books = []
-            if os.path.exists(folder):
-                for item in sorted(os.listdir(folder)):
-                    file_path = os.path.join(folder, item)
-                    if os.path.isfile(file_path):
-                        ext = os.path.splitext(file_path)[1].lower()
-                        if ext in ['.cbz', '.cbr']:
-                            books.append({
-                                'path': file_path,
-                                'name': item,
-                                'last_page': 0,
-                                'last_read_date': None
-                            })
-            self.series[series_name]['books'] = books
-            self.save_library()
+            series = self.series[series_name]
+            books, changed, fingerprints = self.scan_series_books(series['folder'], series['books'])
+            if changed:
+                self.apply_series_books(series_name, books, fingerprints)
+            return changed
+        return False
     
     def update_last_read(self, file_path, page=0):
         """Son okunan sayfa ve tarihi günceller"""
-        for series in self.series.values():
-            for book in series['books']:
-                if book['path'] == file_path:
-                    book['last_page'] = page
-                    book['last_read_date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    series['last_read'] = file_path
-                    self.save_library()
-                    return True
-        return False
+        series_name, book = self.find_book(file_path)
+        if book is None:
+            return False
+        book['last_page'] = page
+        book['last_read_date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.series[series_name]['last_read'] = file_path
+        self._push_last_read(book)
+        if self.store:
+            self.store.update_progress(series_name, book)
+        else:
+            self.schedule_save()
+        return True
     
     def get_last_read(self):
         """En son okunan kitabı ve sayfayı döndürür"""
-        last_file = None
-        last_page = 0
-        last_date = None
-        
-        for series in self.series.values():
-            for book in series['books']:
-                if book.get('last_read_date'):
-                    if not last_date or book['last_read_date'] > last_date:
-                        last_file = book['path']
-                        last_page = book['last_page']
-                        last_date = book['last_read_date']
-        
-        return last_file, last_page
+        # Tepedeki eskimiş girdileri at
+        while self.last_read_heap and not self._is_current(self.last_read_heap[0]):
+            heapq.heappop(self.last_read_heap)
+        if not self.last_read_heap:
+            return None, 0
+
+        _, book = self.book_index[self.last_read_heap[0][1]]
+        return book['path'], book['last_page']
+
+class ImageCache:
+    """Bellek bütçesiyle sınırlı LRU görüntü önbelleği"""
+    def __init__(self, budget_mb=256):
+        self.entries = OrderedDict()
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.used_bytes = 0
+        self.pinned = set()  # Mevcut sayfanın çevresinde tutulacak sayfalar
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def size_of(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key):
+        pixmap = self.entries.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        if key in self.entries:
+            self.used_bytes -= self.size_of(self.entries.pop(key))
+        self.entries[key] = pixmap
+        self.used_bytes += self.size_of(pixmap)
+        self._evict()
+
+    def pin(self, keys):
+        """Verilen sayfaları tahliyeden korur"""
+        self.pinned = set(keys)
+
+    def set_budget(self, budget_mb):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._evict()
+
+    def _evict(self):
+        # En az kullanılan sayfadan başlayarak bütçeye inene kadar sil
+        if self.used_bytes <= self.budget_bytes:
+            return
+        for key in list(self.entries):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            if key in self.pinned:
+                continue
+            self.used_bytes -= self.size_of(self.entries.pop(key))
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.pinned.clear()
+        self.used_bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "used_mb": self.used_bytes / (1024 * 1024),
+            "budget_mb": self.budget_bytes / (1024 * 1024),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
 
 class ImageManager:
     def __init__(self):
         self.zoom_level = 1.0
         self.zoom_step = 0.1
+        self.min_zoom = 0.5
+        self.max_zoom = 5.0
         self.rotation = 0
+        self.mirrored = False
         self.scroll_pos = QPoint(0, 0)
+        self.zoomed_size = QSize(0, 0)  # Kırpılmadan önceki ölçekli sayfa boyutu
         self.double_page_mode = False
-        self.image_cache = {}
-        self.cache_size = 5  # Önbellekte tutulacak sayfa sayısı
+        self.image_cache = ImageCache()
+        self.keep_behind = 1  # Tahliyeden korunan önceki sayfa sayısı
+        self.keep_ahead = 2  # Tahliyeden korunan sonraki sayfa sayısı
         self.current_pixmap = None
+        self.page_source = None  # Arşivden sayfa okuyan kaynak
+        self.read_ahead_pages = []  # Önceden açılan sonraki kitabın sayfaları
+        self.decode_size = None  # Ekranda gereken en büyük boyut; çözme buna göre küçültülür
+        self.source_sizes = {}  # sayfa -> özgün çözünürlük
+        self.page_info = {}  # sayfa -> [genişlik, yükseklik, biçim, geniş_mi] (başlıklardan)
+
+        # Ekrana hazır (döndürülmüş, aynalanmış, ölçeklenmiş) görüntü önbelleği
+        self.scaled_cache = ImageCache(budget_mb=64)
+        # Yakınlaştırmada sayfa döşemelere bölünür, yalnızca görünen döşemeler üretilir
+        self.tile_size = 512
+        self.tile_cache = ImageCache(budget_mb=96)
+        self.current_key = None
+        self.refine_request = None
+        self.refine_timer = QTimer()
+        self.refine_timer.setSingleShot(True)
+        self.refine_timer.setInterval(80)
+        self.refine_timer.timeout.connect(self.refine_current_page)
 
     def clear_cache(self):
         """Önbelleği temizler"""
+        self.refine_timer.stop()
+        self.refine_request = None
         self.image_cache.clear()
+        self.scaled_cache.clear()
+        self.tile_cache.clear()
+        self.source_sizes.clear()
+        self.current_key = None
         self.current_pixmap = None
 
-    def get_cached_image(self, page_path):
-        """Önbellekten görüntüyü alır veya yükler"""
-        if page_path in self.image_cache:
-            return self.image_cache[page_path]
-        
-        # Önbellek doluysa en eski görüntüyü sil
-        if len(self.image_cache) >= self.cache_size:
-            oldest_key = next(iter(self.image_cache))
-            del self.image_cache[oldest_key]
+    def zoom_in(self):
+        self.zoom_level = min(self.max_zoom, round(self.zoom_level + self.zoom_step, 2))
+        return f"Yakınlaştırma: {int(self.zoom_level * 100)}%"
+
+    def zoom_out(self):
+        if self.zoom_level <= self.min_zoom:
+            return None
+        self.zoom_level = max(self.min_zoom, round(self.zoom_level - self.zoom_step, 2))
+        return f"Yakınlaştırma: {int(self.zoom_level * 100)}%"
+
+    def reset_zoom(self):
+        self.zoom_level = 1.0
+        self.scroll_pos = QPoint(0, 0)
+        return "Yakınlaştırma sıfırlandı"
+
+    def rotate_left(self):
+        self.rotation = (self.rotation - 90) % 360
+        return f"Döndürme: {self.rotation}°"
+
+    def rotate_right(self):
+        self.rotation = (self.rotation + 90) % 360
+        return f"Döndürme: {self.rotation}°"
+
+    def reset_rotation(self):
+        self.rotation = 0
+        return "Döndürme sıfırlandı"
+
+    def toggle_double_page(self):
+        self.double_page_mode = not self.double_page_mode
+        return "Çift sayfa modu " + ("açık" if self.double_page_mode else "kapalı")
+
+    def update_scroll_position(self, mouse_pos, label_size, pixmap_size):
+        """Fare konumuna göre yakınlaştırılmış sayfadaki görünür alanı kaydırır"""
+        overflow_x = max(0, pixmap_size.width() - label_size.width())
+        overflow_y = max(0, pixmap_size.height() - label_size.height())
+        ratio_x = min(max(mouse_pos.x() / max(1, label_size.width()), 0.0), 1.0)
+        ratio_y = min(max(mouse_pos.y() / max(1, label_size.height()), 0.0), 1.0)
+        self.scroll_pos = QPoint(int(overflow_x * ratio_x), int(overflow_y * ratio_y))
+
+    def decode_image(self, page_path, page_source=None, max_size=None):
+        """Sayfayı QImage olarak çözer, max_size verilirse o boyuta küçülterek (arka planda da güvenlidir)"""
+        data = page_source.read_page(page_path) if page_source else None
+        known = self.page_dimensions(page_path)
+        fits = max_size is None or (
+            known is not None and known.width() <= max_size.width() and known.height() <= max_size.height())
+        if data is not None and fits:
+            # Küçültme gerekmiyor: bellek görünümü kopyalanmadan doğrudan çözülür
+            image = QImage()
+            if image.loadFromData(data):
+                self.source_sizes[page_path] = image.size()
+            return image
+        if data is not None:
+            buffer = QBuffer()
+            buffer.setData(data)  # Bellek görünümü tek kopyayla tampona alınır
+            buffer.open(QIODevice.ReadOnly)
+            reader = QImageReader(buffer)
+        else:
+            reader = QImageReader(page_path)
+
+        original = reader.size()
+        if original.isValid():
+            self.source_sizes[page_path] = original
+            # JPEG'de Qt küçültmeyi DCT aşamasında yapar; tam çözünürlük hiç açılmaz
+            if max_size and (original.width() > max_size.width() or original.height() > max_size.height()):
+                reader.setScaledSize(original.scaled(max_size, Qt.KeepAspectRatio))
+        return reader.read()
+
+    def required_size(self, target_size):
+        """Yakınlaştırma ve döndürmeyle birlikte ekranda gereken görüntü boyutu"""
+        width = int(target_size.width() * self.zoom_level)
+        height = int(target_size.height() * self.zoom_level)
+        if self.rotation % 180 == 90:
+            width, height = height, width
+        return QSize(max(1, width), max(1, height))
+
+    def set_page_info(self, file_path, pages):
+        """Açık arşivin başlıklardan okunan sayfa bilgilerini yükler"""
+        self.page_info = {os.path.join(file_path, member): entry for member, entry in pages.items()}
+
+    def page_dimensions(self, page_path):
+        """Sayfanın özgün boyutu; piksel çözmeden bilinmiyorsa None"""
+        entry = self.page_info.get(page_path)
+        if entry:
+            return QSize(entry[0], entry[1])
+        return self.source_sizes.get(page_path)
+
+    def is_wide(self, page_path):
+        """Sayfa çift sayfalık (yatay) bir açılım mı"""
+        size = self.page_dimensions(page_path)
+        return bool(size) and size.width() > size.height()
+
+    def is_sufficient(self, page_path, pixmap, min_size):
+        """Önbellekteki görüntü istenen boyut için yeterince büyük mü"""
+        if min_size is None or pixmap.size() == self.page_dimensions(page_path):
+            return True
+        needed = pixmap.size().scaled(min_size, Qt.KeepAspectRatio)
+        return pixmap.width() >= needed.width() - 1 and pixmap.height() >= needed.height() - 1
+
+    def store_image(self, page_path, pixmap):
+        """Çözülmüş görüntüyü önbelleğe ekler"""
+        if page_path not in self.image_cache:
+            self.image_cache.put(page_path, pixmap)
+
+    def spread_at(self, pages, current_page):
+        """Gösterilecek sayfa: tek sayfa yolu ya da yan yana gösterilecek iki sayfanın demeti"""
+        page_path = pages[current_page]
+        if not self.double_page_mode or current_page + 1 >= len(pages):
+            return page_path
+        next_path = pages[current_page + 1]
+        # Yatay (çift sayfalık) açılımlar tek başına gösterilir
+        if self.is_wide(page_path) or self.is_wide(next_path):
+            return page_path
+        return (page_path, next_path)
+
+    def page_step(self, pages, current_page):
+        """İleri giderken atlanacak sayfa sayısı"""
+        spread = self.spread_at(pages, current_page)
+        return len(spread) if isinstance(spread, tuple) else 1
+
+    def previous_step(self, pages, current_page):
+        """Geri giderken atlanacak sayfa sayısı"""
+        if self.double_page_mode and current_page >= 2 and self.page_step(pages, current_page - 2) == 2:
+            return 2
+        return 1
+
+    def get_spread_image(self, spread, min_size=None):
+        """İki sayfayı ekran çözünürlüğünde yan yana birleştirir; birleşik açılım önbelleğe alınır"""
+        pixmap = self.image_cache.get(spread)
+        if pixmap is not None and self.is_sufficient(spread, pixmap, min_size):
+            return pixmap
+
+        halves = [self.get_cached_image(page_path, min_size) for page_path in spread]
+        if not all(halves):
+            return pixmap
+        # İki sayfa ortak yüksekliğe getirilir, yükseklik ekranda gerekenle sınırlanır
+        height = min(half.height() for half in halves)
+        capped = min_size is not None and height > min_size.height()
+        if capped:
+            height = min_size.height()
+        widths = [max(1, round(half.width() * height / half.height())) for half in halves]
+
+        pixmap = QPixmap(sum(widths), height)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        x = 0
+        for half, width in zip(halves, widths):
+            painter.drawPixmap(QRect(x, 0, width, height), half)
+            x += width
+        painter.end()
+
+        # Her iki sayfa da özgün çözünürlükteyse daha büyüğü üretilemez
+        native = all(half.size() == self.page_dimensions(page_path) for half, page_path in zip(halves, spread))
+        if native and not capped:
+            self.source_sizes[spread] = pixmap.size()
+        self.image_cache.put(spread, pixmap)
+        return pixmap
+
+    def get_cached_image(self, page_path, min_size=None):
+        """Önbellekten görüntüyü alır; yoksa veya çok küçükse gereken boyutta yeniden çözer"""
+        if isinstance(page_path, tuple):
+            return self.get_spread_image(page_path, min_size)
+        pixmap = self.image_cache.get(page_path)
+        if pixmap is not None and self.is_sufficient(page_path, pixmap, min_size):
+            return pixmap
         
         # Yeni görüntüyü yükle ve önbelleğe ekle
         try:
-            pixmap = QPixmap(page_path)
-            if not pixmap.isNull():
-                self.image_cache[page_path] = pixmap
+            image = self.decode_image(page_path, self.page_source, min_size)
+            if not image.isNull():
+                pixmap = QPixmap.fromImage(image)
+                self.image_cache.put(page_path, pixmap)
                 return pixmap
         except Exception as e:
             print(f"Görüntü yükleme hatası: {e}")
-        return None
+        return pixmap
+
+    def view_key(self, page_path, target_size):
+        """Ekrana hazır görüntü için önbellek anahtarı"""
+        return (
+            page_path, target_size.width(), target_size.height(),
+            self.rotation, self.mirrored, round(self.zoom_level, 2)
+        )
+
+    def transform_pixmap(self, pixmap, target_size, mode):
+        """Sayfayı ölçekler, döndürür ve aynalar"""
+        # Önce küçült, sonra döndür: döndürme tam çözünürlük yerine ekran boyutunda yapılır
+        pixmap = pixmap.scaled(self.required_size(target_size), Qt.KeepAspectRatio, mode)
+
+        # Döndürme
+        if self.rotation != 0:
+            transform = QTransform()
+            transform.rotate(self.rotation)
+            pixmap = pixmap.transformed(transform, mode)
+
+        # Ayna görüntüsü
+        if self.mirrored:
+            pixmap = pixmap.transformed(QTransform().scale(-1, 1))
+
+        return pixmap
+
+    def crop_to_view(self, pixmap, target_size):
+        """Yakınlaştırılmış sayfanın görünür kısmını keser"""
+        self.zoomed_size = pixmap.size()
+        if pixmap.width() <= target_size.width() and pixmap.height() <= target_size.height():
+            return pixmap
+
+        max_x = max(0, pixmap.width() - target_size.width())
+        max_y = max(0, pixmap.height() - target_size.height())
+        self.scroll_pos = QPoint(
+            min(max(self.scroll_pos.x(), 0), max_x),
+            min(max(self.scroll_pos.y(), 0), max_y)
+        )
+        return pixmap.copy(QRect(
+            self.scroll_pos.x(), self.scroll_pos.y(),
+            min(pixmap.width(), target_size.width()),
+            min(pixmap.height(), target_size.height())
+        ))
 
-    def show_page(self, image_label, pages, current_page):
+    def view_transform(self, pixmap, target_size):
+        """Kaynak görüntüden yakınlaştırılmış görünüme dönüşümü ve görünümün boyutunu döndürür"""
+        scaled = pixmap.size().scaled(self.required_size(target_size), Qt.KeepAspectRatio)
+        transform = QTransform.fromScale(scaled.width() / pixmap.width(), scaled.height() / pixmap.height())
+        transform *= QTransform().rotate(self.rotation)
+        if self.mirrored:
+            transform *= QTransform.fromScale(-1, 1)
+        bounds = transform.mapRect(QRectF(pixmap.rect()))
+        transform *= QTransform.fromTranslate(-bounds.x(), -bounds.y())
+        return transform, QSize(round(bounds.width()), round(bounds.height()))
+
+    def get_tile(self, key, pixmap, transform, view_size, tx, ty):
+        """Görünümdeki bir döşemeyi önbellekten alır veya yalnızca ilgili kaynak bölgeden üretir"""
+        tile_key = key + (tx, ty)
+        tile = self.tile_cache.get(tile_key)
+        if tile is not None:
+            return tile
+
+        rect = QRect(tx * self.tile_size, ty * self.tile_size, self.tile_size, self.tile_size)
+        rect = rect.intersected(QRect(QPoint(0, 0), view_size))
+        tile = QPixmap(rect.size())
+        tile.fill(Qt.transparent)
+        source_rect = transform.inverted()[0].mapRect(QRectF(rect))
+        source_rect = source_rect.adjusted(-2, -2, 2, 2).intersected(QRectF(pixmap.rect()))
+
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.setTransform(transform * QTransform.fromTranslate(-rect.x(), -rect.y()))
+        painter.drawPixmap(source_rect, pixmap, source_rect)
+        painter.end()
+
+        self.tile_cache.put(tile_key, tile)
+        return tile
+
+    def render_tiled(self, page_path, target_size, key):
+        """Yakınlaştırılmış sayfanın yalnızca görünen döşemelerini birleştirir"""
+        pixmap = self.get_cached_image(page_path, self.decode_size)
+        if not pixmap:
+            return None
+        transform, view_size = self.view_transform(pixmap, target_size)
+        self.zoomed_size = view_size
+
+        width = min(view_size.width(), target_size.width())
+        height = min(view_size.height(), target_size.height())
+        self.scroll_pos = QPoint(
+            min(max(self.scroll_pos.x(), 0), view_size.width() - width),
+            min(max(self.scroll_pos.y(), 0), view_size.height() - height)
+        )
+        viewport = QRect(self.scroll_pos, QSize(width, height))
+
+        frame = QPixmap(viewport.size())
+        frame.fill(Qt.transparent)
+        painter = QPainter(frame)
+        size = self.tile_size
+        for ty in range(viewport.top() // size, viewport.bottom() // size + 1):
+            for tx in range(viewport.left() // size, viewport.right() // size + 1):
+                tile = self.get_tile(key, pixmap, transform, view_size, tx, ty)
+                painter.drawPixmap(tx * size - viewport.x(), ty * size - viewport.y(), tile)
+        painter.end()
+        return frame
+
+    def render_page(self, page_path, target_size, fast=False):
+        """Sayfayı ekrana hazır hale getirir; hızlı modda yumuşatma sonraya bırakılır"""
+        key = self.view_key(page_path, target_size)
+        self.current_key = key
+
+        needs_refine = False
+        self.decode_size = self.required_size(target_size)
+        if self.zoom_level > 1.0:
+            frame = self.render_tiled(page_path, target_size, key)
+            return (frame, False) if frame else None
+        scaled = self.scaled_cache.get(key)
+        if scaled is None:
+            # Hızlı modda önbellekteki küçük görüntü de yeterli; yumuşatmada gerekirse yeniden çözülür
+            pixmap = self.get_cached_image(page_path, None if fast and page_path in self.image_cache else self.decode_size)
+            if not pixmap:
+                return None
+            if fast:
+                scaled = self.transform_pixmap(pixmap, target_size, Qt.FastTransformation)
+                needs_refine = True
+            else:
+                scaled = self.transform_pixmap(pixmap, target_size, Qt.SmoothTransformation)
+                self.scaled_cache.put(key, scaled)
+
+        return self.crop_to_view(scaled, target_size), needs_refine
+
+    def refine_current_page(self):
+        """Hızlı çizilen sayfayı yumuşak ölçeklemeyle yeniden çizer"""
+        if not self.refine_request:
+            return
+        image_label, page_path, key = self.refine_request
+        self.refine_request = None
+        # Bu arada görünüm değiştiyse eski isteği bırak
+        if key != self.current_key:
+            return
+        result = self.render_page(page_path, image_label.size())
+        if result:
+            image_label.setPixmap(result[0])
+            self.current_pixmap = result[0]
+
+    def show_page(self, image_label, pages, current_page, fast=False):
         """Sayfayı görüntüler"""
         if not pages or not (0 <= current_page < len(pages)):
             return None
 
         try:
-            # Önbellekten görüntüyü al
-            pixmap = self.get_cached_image(pages[current_page])
-            if not pixmap:
+            page_path = self.spread_at(pages, current_page)
+            shown = len(page_path) if isinstance(page_path, tuple) else 1
+
+            # Mevcut sayfanın çevresini önbellekte tut
+            start = max(0, current_page - self.keep_behind * shown)
+            keep = pages[start:current_page + self.keep_ahead * shown + 1] + self.read_ahead_pages
+            self.image_cache.pin(keep + [page_path])
+
+            result = self.render_page(page_path, image_label.size(), fast)
+            if not result:
                 return None
+            display_pixmap, needs_refine = result
 
-            # Döndürme
-            if self.rotation != 0:
-                transform = QTransform()
-                transform.rotate(self.rotation)
-                pixmap = pixmap.transformed(transform, Qt.SmoothTransformation)
-
-            # Ayna görüntüsü
-            if self.mirrored:
-                pixmap = pixmap.transformed(QTransform().scale(-1, 1))
-
-            # Ölçeklendirme
-            scaled_pixmap = pixmap.scaled(
-                image_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
             # Görüntüyü ayarla
-            image_label.setPixmap(scaled_pixmap)
-            self.current_pixmap = scaled_pixmap
-            
+            image_label.setPixmap(display_pixmap)
+            self.current_pixmap = display_pixmap
+
+            if needs_refine:
+                self.refine_request = (image_label, page_path, self.current_key)
+                self.refine_timer.start()
+
+            if shown == 2:
+                return f"Sayfa: {current_page + 1}-{current_page + 2} / {len(pages)}"
             return f"Sayfa: {current_page + 1} / {len(pages)}"
         except Exception as e:
             print(f"Sayfa gösterim hatası: {e}")
             return None
 
+class PageDecodeTask(QRunnable):
+    """Bir sayfayı arka planda QImage olarak çözer"""
+    def __init__(self, scheduler, generation, page_path, page_source, max_size=None):
+        super().__init__()
+        self.scheduler = scheduler
+        self.generation = generation
+        self.page_path = page_path
+        self.page_source = page_source
+        self.max_size = max_size
+
+    def run(self):
+        # İptal edilmiş bir istek ise hiç çözme
+        if self.generation != self.scheduler.generation:
+            return
+        try:
+            image = self.scheduler.image_manager.decode_image(self.page_path, self.page_source, self.max_size)
+        except Exception as e:
+            print(f"Ön yükleme hatası: {e}")
+            image = QImage()
+        self.scheduler.page_decoded.emit(self.generation, self.page_path, image)
+
+class PrefetchScheduler(QObject):
+    """Sonraki ve önceki sayfaları iş parçacığı havuzunda önceden çözer"""
+    page_decoded = pyqtSignal(int, str, QImage)
+
+    def __init__(self, image_manager, ahead=3, behind=1, parent=None):
+        super().__init__(parent)
+        self.image_manager = image_manager
+        self.ahead = ahead  # Okuma yönünde çözülecek sayfa sayısı
+        self.behind = behind  # Ters yönde çözülecek sayfa sayısı
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(4, QThreadPool.globalInstance().maxThreadCount() - 1)))
+        self.generation = 0
+        self.pending = set()
+        self.last_page = None
+        self.direction = 1
+        self.page_decoded.connect(self.on_page_decoded)
+
+    def cancel(self):
+        """Bekleyen tüm ön yükleme isteklerini iptal eder"""
+        self.generation += 1
+        self.pool.clear()
+        self.pending.clear()
+
+    def reset(self):
+        self.cancel()
+        self.last_page = None
+        self.direction = 1
+
+    def schedule(self, pages, current_page, step=1):
+        """Mevcut sayfanın çevresindeki sayfaları okuma yönüne göre sıraya koyar"""
+        if not pages:
+            return
+
+        if self.last_page is not None and current_page != self.last_page:
+            new_direction = 1 if current_page > self.last_page else -1
+            # Atlama veya yön değişikliğinde eski istekler geçersizdir
+            if abs(current_page - self.last_page) > step or new_direction != self.direction:
+                self.cancel()
+            self.direction = new_direction
+        self.last_page = current_page
+
+        forward = [current_page + i * self.direction for i in range(1, self.ahead * step + 1)]
+        backward = [current_page - i * self.direction for i in range(1, self.behind * step + 1)]
+        for index in forward + backward:
+            if not (0 <= index < len(pages)):
+                continue
+            page_path = pages[index]
+            if page_path in self.image_manager.image_cache or page_path in self.pending:
+                continue
+            self.pending.add(page_path)
+            self.pool.start(PageDecodeTask(
+                self, self.generation, page_path, self.image_manager.page_source, self.image_manager.decode_size
+            ))
+
+    @pyqtSlot(int, str, QImage)
+    def on_page_decoded(self, generation, page_path, image):
+        """Çözülen görüntüyü GUI iş parçacığında önbelleğe ekler"""
+        if generation != self.generation:
+            return
+        self.pending.discard(page_path)
+        if not image.isNull():
+            self.image_manager.store_image(page_path, QPixmap.fromImage(image))
+
+class PageMetadataTask(QRunnable):
+    """Arşivdeki sayfa başlıklarını arka planda okur"""
+    def __init__(self, index, file_path):
+        super().__init__()
+        self.index = index
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            record = self.index.scan(self.file_path)
+        except Exception as e:
+            print(f"Sayfa bilgisi hatası ({self.file_path}): {e}")
+            record = None
+        self.index.metadata_ready.emit(self.file_path, record)
+
+class PageMetadataIndex(QObject):
+    """Sayfaların boyut ve biçimini yalnızca başlıklardan okur, kütüphaneden ayrı bir önbellekte saklar"""
+    metadata_ready = pyqtSignal(str, object)
+    HEADER_SIZE = 65536
+
+    def __init__(self, cache_dir="page_info", max_entries=64, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.memory = OrderedDict()  # yol -> {'fingerprint': [mtime_ns, boyut], 'pages': {üye: [g, y, biçim, geniş]}}
+        self.pending = set()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.metadata_ready.connect(self.on_metadata_ready)
+
+    @staticmethod
+    def fingerprint(file_path):
+        stat = os.stat(file_path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @staticmethod
+    def parse_header(data):
+        """Görüntü başlığından boyut ve biçimi okur; pikseller çözülmez"""
+        buffer = QBuffer()
+        buffer.setData(data or b"")
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+        return reader.size(), bytes(reader.format()).decode('ascii', 'ignore')
+
+    def get(self, file_path):
+        """Geçerli sayfa bilgisini döndürür; yoksa üretimi sıraya koyar ve None döndürür"""
+        try:
+            fingerprint = self.fingerprint(file_path)
+        except OSError:
+            return None
+        record = self.memory.get(file_path)
+        if record and record['fingerprint'] == fingerprint:
+            self.memory.move_to_end(file_path)
+            return record['pages']
+        if file_path not in self.pending:
+            self.pending.add(file_path)
+            self.pool.start(PageMetadataTask(self, file_path))
+        return None
+
+    def scan(self, file_path):
+        """Kaydı diskteki önbellekten yükler, yoksa tüm sayfaların başlıklarını okuyup üretir"""
+        fingerprint = self.fingerprint(file_path)
+        cache_path = content_cache_path(self.cache_dir, file_path, ".json")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return {'fingerprint': fingerprint, 'pages': json.load(f)}
+            except (OSError, ValueError) as e:
+                print(f"Sayfa bilgisi okuma hatası: {e}")
+
+        source = FileManager.create_page_source(file_path)
+        if source is None:
+            return None
+        pages = {}
+        try:
+            for page_path, data in source.read_headers(self.HEADER_SIZE):
+                size, image_format = self.parse_header(data)
+                if not size.isValid():
+                    # Başlık ilk baytlara sığmadıysa (ör. büyük EXIF) üyenin tamamı okunur
+                    size, image_format = self.parse_header(source.read_page(page_path))
+                if size.isValid():
+                    member = page_path[len(file_path) + 1:]
+                    pages[member] = [size.width(), size.height(), image_format, size.width() > size.height()]
+        finally:
+            source.close()
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(pages, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Sayfa bilgisi kaydetme hatası: {e}")
+        return {'fingerprint': fingerprint, 'pages': pages}
+
+    @pyqtSlot(str, object)
+    def on_metadata_ready(self, file_path, record):
+        self.pending.discard(file_path)
+        if record is None:
+            return
+        self.memory[file_path] = record
+        self.memory.move_to_end(file_path)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+class BookOpenTask(QRunnable):
+    """Sonraki kitabı arka planda açar ve ilk sayfalarını çözer"""
+    def __init__(self, read_ahead, generation, file_path, max_size=None):
+        super().__init__()
+        self.read_ahead = read_ahead
+        self.generation = generation
+        self.file_path = file_path
+        self.max_size = max_size
+
+    def run(self):
+        if self.generation != self.read_ahead.generation:
+            return
+        try:
+            source = FileManager.create_page_source(self.file_path)
+        except Exception as e:
+            print(f"Sonraki kitap açma hatası ({self.file_path}): {e}")
+            return
+        if source is None:
+            return
+        # Kaynağı her durumda bildir; iptal edildiyse GUI tarafı kapatır
+        self.read_ahead.book_opened.emit(self.generation, self.file_path, source)
+        for page_path in source.pages[:self.read_ahead.pages]:
+            if self.generation != self.read_ahead.generation:
+                return
+            try:
+                image = self.read_ahead.image_manager.decode_image(page_path, source, self.max_size)
+            except Exception as e:
+                print(f"Ön yükleme hatası: {e}")
+                continue
+            self.read_ahead.page_decoded.emit(self.generation, page_path, image)
+
+class BookReadAhead(QObject):
+    """Kitabın sonuna yaklaşıldığında klasördeki sonraki kitabı hazırlar"""
+    book_opened = pyqtSignal(int, str, object)
+    page_decoded = pyqtSignal(int, str, QImage)
+
+    def __init__(self, file_manager, image_manager, threshold=3, pages=2, parent=None):
+        super().__init__(parent)
+        self.file_manager = file_manager
+        self.image_manager = image_manager
+        self.threshold = threshold  # Sona kaç sayfa kala başlanacağı
+        self.pages = pages  # Önceden çözülecek ilk sayfa sayısı
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.generation = 0
+        self.file_path = None
+        self.source = None
+        self.book_opened.connect(self.on_book_opened)
+        self.page_decoded.connect(self.on_page_decoded)
+
+    def check(self, current_file, pages, current_page):
+        """Sona yaklaşıldıysa sonraki kitabı açmayı başlatır"""
+        if not current_file or len(pages) - current_page > self.threshold:
+            return
+        next_file = self.file_manager.get_next_file_in_directory(current_file)
+        if next_file == self.file_path:
+            return
+        self.discard()
+        if next_file and os.path.splitext(next_file)[1].lower() in ['.cbz', '.cbr']:
+            self.file_path = next_file
+            self.pool.start(BookOpenTask(self, self.generation, next_file, self.image_manager.decode_size))
+
+    def take(self, file_path):
+        """Hazırlanmış kaynağı devralır; bu dosya için hazırlık yoksa None döndürür"""
+        if file_path != self.file_path or self.source is None:
+            self.discard()
+            return None
+        source = self.source
+        self.source = None
+        self.discard()
+        return source
+
+    def discard(self):
+        """Hazırlığı iptal eder ve kullanılmayan kaynağı kapatır"""
+        self.generation += 1
+        self.pool.clear()
+        self.file_path = None
+        self.image_manager.read_ahead_pages = []
+        if self.source:
+            self.source.close()
+            self.source = None
+
+    @pyqtSlot(int, str, object)
+    def on_book_opened(self, generation, file_path, source):
+        if generation != self.generation:
+            source.close()
+            return
+        self.source = source
+        self.image_manager.read_ahead_pages = source.pages[:self.pages]
+
+    @pyqtSlot(int, str, QImage)
+    def on_page_decoded(self, generation, page_path, image):
+        if generation == self.generation and not image.isNull():
+            self.image_manager.store_image(page_path, QPixmap.fromImage(image))
+
+class SeriesScanTask(QRunnable):
+    """Tek bir seri klasörünü arka planda tarar"""
+    def __init__(self, job, generation, series_name, folder, old_books):
+        super().__init__()
+        self.job = job
+        self.generation = generation
+        self.series_name = series_name
+        self.folder = folder
+        self.old_books = old_books
+
+    def run(self):
+        if self.generation != self.job.generation:
+            return  # Yenileme iptal edildi
+        try:
+            books, changed, fingerprints = self.job.library.scan_series_books(self.folder, self.old_books)
+        except Exception as e:
+            print(f"Seri tarama hatası ({self.series_name}): {e}")
+            books, changed, fingerprints = self.old_books, False, {}
+        self.job.series_scanned.emit(self.generation, self.series_name, (books, fingerprints), changed)
+
+class LibraryRefreshJob(QObject):
+    """Tüm serileri paralel tarar, sonuçları sonunda tek seferde kaydeder; tek örnek yeniden kullanılır"""
+    progress = pyqtSignal(int, int, str)  # taranan, toplam, seri adı
+    finished = pyqtSignal(bool)  # iptal edildi mi
+    series_scanned = pyqtSignal(int, str, object, bool)
+
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(4)  # Ağ paylaşımlarında gecikmeyi örtmek için
+        self.results = {}
+        self.total = 0
+        self.running = False
+        self.generation = 0  # İptal edilen taramaların geç gelen sonuçları yok sayılır
+        self.series_scanned.connect(self.on_series_scanned)
+
+    def start(self):
+        self.generation += 1
+        self.results = {}
+        self.running = True
+        self.total = len(self.library.series)
+        if not self.total:
+            self.commit()
+            return
+        for series_name, series in self.library.series.items():
+            self.pool.start(SeriesScanTask(self, self.generation, series_name, series['folder'], list(series['books'])))
+
+    def cancel(self):
+        if not self.running:
+            return
+        self.generation += 1
+        self.running = False
+        self.pool.clear()
+        self.finished.emit(True)
+
+    @pyqtSlot(int, str, object, bool)
+    def on_series_scanned(self, generation, series_name, result, changed):
+        if not self.running or generation != self.generation:
+            return
+        books, fingerprints = result
+        self.results[series_name] = (books, fingerprints, changed)
+        self.progress.emit(len(self.results), self.total, series_name)
+        if len(self.results) == self.total:
+            self.commit()
+
+    def commit(self):
+        """Değişen serileri uygular; yalnızca değişen seriler kaydedilir"""
+        self.running = False
+        changed_series = []
+        for series_name, (books, fingerprints, changed) in self.results.items():
+            if changed and series_name in self.library.series:
+                self.library.apply_series_books(series_name, books, fingerprints, persist=False)
+                changed_series.append(series_name)
+        if self.library.store:
+            for series_name in changed_series:
+                self.library.store.replace_series_books(series_name, self.library.series[series_name]['books'])
+        elif changed_series:
+            self.library.save_library()
+        self.finished.emit(False)
+
+class LibraryWatcher(QObject):
+    """Seri klasörlerini izler, değişen klasörleri kütüphaneye artımlı olarak yansıtır"""
+    library_changed = pyqtSignal()
+    directories_found = pyqtSignal(object)
+
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.directories_found.connect(self.add_directories)
+
+        # Dosya kopyalama sırasında gelen olay yağmurunu birleştir
+        self.pending = set()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.process_pending)
+
+    def sync(self):
+        """Tüm seri klasörlerini alt klasörleriyle birlikte izlemeye alır"""
+        folders = [series['folder'] for series in self.library.series.values()]
+        threading.Thread(target=self._collect_directories, args=(folders,), daemon=True).start()
+
+    def _collect_directories(self, folders):
+        directories = []
+        for folder in folders:
+            directories.extend(self.library.walk_directories(folder))
+        self.directories_found.emit(directories)
+
+    @pyqtSlot(object)
+    def add_directories(self, directories):
+        watched = set(self.watcher.directories())
+        new = [d for d in dict.fromkeys(directories) if d not in watched]
+        if new:
+            self.watcher.addPaths(new)
+
+    def on_directory_changed(self, directory):
+        self.pending.add(directory)
+        self.timer.start()
+
+    def process_pending(self):
+        pending, self.pending = self.pending, set()
+        changed_any = False
+        new_directories = []
+        for directory in pending:
+            for series_name in self.library.series_for_directory(directory):
+                try:
+                    changed, found = self.library.update_directory(
+                        series_name, directory, self.watcher.directories()
+                    )
+                except OSError as e:
+                    print(f"Klasör güncelleme hatası ({directory}): {e}")
+                    continue
+                changed_any = changed_any or changed
+                new_directories.extend(found)
+            if not os.path.isdir(directory):
+                self.watcher.removePath(directory)
+        self.add_directories(new_directories)
+        if changed_any:
+            self.library_changed.emit()
+
+class ThumbnailTask(QRunnable):
+    """Kapak veya sayfa küçük resmini arka planda üretir"""
+    def __init__(self, service, key, file_path, page, size):
+        super().__init__()
+        self.service = service
+        self.key = key
+        self.file_path = file_path
+        self.page = page
+        self.size = size
+
+    def run(self):
+        if self.service.generation != self.key[3]:
+            return
+        try:
+            image = self.service.load_or_create(self.file_path, self.page, self.size)
+        except Exception as e:
+            print(f"Küçük resim hatası ({self.file_path}): {e}")
+            image = QImage()
+        self.service.thumbnail_ready.emit(self.key, image)
+
+class ThumbnailService(QObject):
+    """Küçük resimleri arka planda üretir ve diskte içerik adresli olarak saklar"""
+    thumbnail_ready = pyqtSignal(object, QImage)
+
+    def __init__(self, cache_dir="thumbnails", parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.memory_cache = ImageCache(budget_mb=32)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.pending = set()
+        self.generation = 0
+        self.thumbnail_ready.connect(self.on_thumbnail_ready)
+
+    def load_or_create(self, file_path, page, size):
+        """Diskteki küçük resmi yükler, yoksa yalnızca gereken üyeyi okuyup üretir"""
+        cache_path = content_cache_path(self.cache_dir, file_path, ".jpg", page or '', size)
+        if os.path.exists(cache_path):
+            image = QImage(cache_path)
+            if not image.isNull():
+                return image
+
+        # Ölçeklenmiş çözme: JPEG sayfalar tam çözünürlükte açılmaz
+        buffer = QBuffer()
+        source = FileManager.create_page_source(file_path)
+        if source:
+            try:
+                page = page or (source.pages[0] if source.pages else None)
+                data = source.read_page(page) if page else None
+                if data:
+                    buffer.setData(data)  # Eşleme kapanmadan önce tek kopyayla tampona alınır
+                del data
+            finally:
+                source.close()
+        else:
+            with open(file_path, 'rb') as f:
+                buffer.setData(f.read())
+        if not buffer.size():
+            return QImage()
+
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+        original = reader.size()
+        if original.isValid():
+            reader.setScaledSize(original.scaled(size, size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            return image
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        image.save(cache_path, "JPG", 85)
+        return image
+
+    def request(self, file_path, page=None, size=256):
+        """Küçük resmi döndürür; hazır değilse üretimi sıraya koyar ve None döndürür"""
+        memory_key = (file_path, page, size)
+        pixmap = self.memory_cache.get(memory_key)
+        if pixmap is not None:
+            return pixmap
+        if memory_key not in self.pending and os.path.exists(file_path):
+            self.pending.add(memory_key)
+            key = memory_key + (self.generation,)
+            self.pool.start(ThumbnailTask(self, key, file_path, page, size))
+        return None
+
+    def cancel_pending(self):
+        """Henüz başlamamış istekleri iptal eder"""
+        self.generation += 1
+        self.pool.clear()
+        self.pending.clear()
+
+    @pyqtSlot(object, QImage)
+    def on_thumbnail_ready(self, key, image):
+        memory_key = key[:3]
+        self.pending.discard(memory_key)
+        if not image.isNull():
+            self.memory_cache.put(memory_key, QPixmap.fromImage(image))
+
+class SeriesListModel(QAbstractListModel):
+    """Seri adlarını görünüm için sanal liste olarak sunar"""
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.names = list(library.series)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.UserRole):
+            return self.names[index.row()]
+        return None
+
+    def refresh(self):
+        """Seri listesini kütüphaneden yeniden alır"""
+        self.beginResetModel()
+        self.names = list(self.library.series)
+        self.endResetModel()
+
+class BookListModel(QAbstractListModel):
+    """Seçili serinin kitapları; kapaklar yalnızca görünen satırlar için istenir"""
+    THUMBNAIL_SIZE = 256
+
+    def __init__(self, library, thumbnail_service, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.thumbnail_service = thumbnail_service
+        self.series_name = None
+        self.books = []
+        self.rows = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.books)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        book = self.books[index.row()]
+        if role == Qt.DisplayRole:
+            return book['name']
+        if role == Qt.UserRole:
+            return book['path']
+        if role == Qt.DecorationRole:
+            # Görünüm yalnızca ekrandaki satırları sorar, üretim burada tetiklenir
+            pixmap = self.thumbnail_service.request(book['path'], size=self.THUMBNAIL_SIZE)
+            return QIcon(pixmap) if pixmap else None
+        return None
+
+    def set_series(self, series_name):
+        """Modeli verilen serinin kitaplarıyla doldurur"""
+        self.beginResetModel()
+        self.series_name = series_name
+        series = self.library.series.get(series_name)
+        self.books = series['books'] if series else []
+        self.rows = {book['path']: row for row, book in enumerate(self.books)}
+        self.endResetModel()
+
+    def refresh(self):
+        self.set_series(self.series_name)
+
+    @pyqtSlot(object, QImage)
+    def on_thumbnail_ready(self, key, image):
+        file_path, page, size = key[:3]
+        row = self.rows.get(file_path)
+        if page is None and size == self.THUMBNAIL_SIZE and row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+class LibraryFilterProxyModel(QSortFilterProxyModel):
+    """Serileri adına veya içindeki kitap adlarına göre arama dizininden süzer"""
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.matches = None  # None: süzgeç yok
+
+    def set_filter_text(self, text):
+        if SearchIndex.tokenize(text):
+            results = self.library.search_index.search(text, ("series", "book"))
+            self.matches = set(results.values())
+        else:
+            self.matches = None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.matches is None:
+            return True
+        return self.sourceModel().names[source_row] in self.matches
+
+class PageTransition(QWidget):
+    """Sayfa geçişini tek, yeniden kullanılan bir katmanda paintEvent ile çizer"""
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.pixmap = None  # Giden sayfa; gelen sayfa zaten alttaki etikette
+        self.kind = "slide"
+        self.direction = "right"
+        self.progress = 0.0
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+        self.animation.valueChanged.connect(self.on_progress)
+        self.animation.finished.connect(self.finish)
+        self.hide()
+
+    def is_running(self):
+        return self.animation.state() == QAbstractAnimation.Running
+
+    def start(self, pixmap, kind, direction, duration):
+        self.animation.stop()
+        self.pixmap = pixmap
+        self.kind = kind
+        self.direction = direction
+        self.progress = 0.0
+        self.setGeometry(self.parentWidget().rect())
+        self.show()
+        self.raise_()
+        self.animation.setDuration(duration)
+        self.animation.start()
+
+    def stop(self):
+        self.animation.stop()
+        self.finish()
+
+    def finish(self):
+        self.hide()
+        self.pixmap = None
+
+    def on_progress(self, value):
+        self.progress = value
+        self.update()
+
+    def paintEvent(self, event):
+        if not self.pixmap:
+            return
+        rect = QRect(QPoint(0, 0), self.pixmap.size())
+        rect.moveCenter(self.rect().center())
+
+        painter = QPainter(self)
+        if self.kind == "slide":
+            dx, dy = {
+                "right": (-self.width(), 0),
+                "left": (self.width(), 0),
+                "up": (0, self.height()),
+                "down": (0, -self.height()),
+            }.get(self.direction, (-self.width(), 0))
+            rect.translate(int(dx * self.progress), int(dy * self.progress))
+        elif self.kind == "fade":
+            painter.setOpacity(1.0 - self.progress)
+        elif self.kind == "zoom":
+            # Giden sayfa ortasına doğru yarı boyuta küçülür
+            center = rect.center()
+            rect.setSize(rect.size() * (1.0 - self.progress / 2))
+            rect.moveCenter(center)
+        painter.drawPixmap(rect, self.pixmap)
+        painter.end()
+
 class ThemeManager:
     def __init__(self):
         self.themes = {
@@ -395,7 +2503,20 @@ class ComicReader(QMainWindow):
         self.file_manager = FileManager()
         self.image_manager = ImageManager()
         self.theme_manager = ThemeManager()
-        self.library = ComicLibrary()
+        # Kütüphane deposu: "json" (varsayılan) veya "sqlite"
+        self.library_backend = self.file_manager.load_json("settings.json").get("library_backend", "json")
+        store = SQLiteLibraryStore("library.db") if self.library_backend == "sqlite" else None
+        self.library = ComicLibrary(store=store)
+        self.prefetcher = PrefetchScheduler(self.image_manager, parent=self)
+        self.read_ahead = BookReadAhead(self.file_manager, self.image_manager, parent=self)
+        self.page_metadata = PageMetadataIndex(parent=self)
+        self.page_metadata.metadata_ready.connect(self.on_page_metadata_ready)
+        self.library_watcher = LibraryWatcher(self.library, self)
+        self.library_watcher.library_changed.connect(
+            lambda: self.statusBar().showMessage("Kütüphane güncellendi")
+        )
+        self.library_watcher.sync()
+        self.thumbnail_service = ThumbnailService(parent=self)
         self.init_variables()
         self.init_ui()
         self.theme_manager.apply_theme(self)
@@ -421,11 +2542,24 @@ class ComicReader(QMainWindow):
         # Sayfa ve görüntüleme değişkenleri
         self.current_page = 0
         self.pages = []
+        self.current_file = None  # Açık olan arşiv veya resim dosyası
         self.mouse_pos = QPoint(0, 0)
 
+        # Çizim zamanlayıcıları
+        self.render_interactive = False
+        self.render_full = False  # Kaydırma dışında bir değişiklik bekliyor mu
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(16)  # Yaklaşık bir ekran karesi
+        self.render_timer.timeout.connect(self.flush_render)
+        self.render_settle_timer = QTimer(self)
+        self.render_settle_timer.setSingleShot(True)
+        self.render_settle_timer.setInterval(150)
+        self.render_settle_timer.timeout.connect(self.finish_interactive_render)
+
         # Kütüphane ve veri yönetimi
-        self.favorites = self.file_manager.load_json("favorites.json")
-        self.notes = self.file_manager.load_json("notes.json")
+        self.favorites = self.library.load_favorites()
+        self.notes = self.library.load_notes()
 
         # Otomatik oynatma ve kaydırma
         self.auto_play = False
@@ -435,8 +2569,11 @@ class ComicReader(QMainWindow):
 
         self.auto_scroll = False
         self.auto_scroll_timer = QTimer(self)
+        self.auto_scroll_timer.setInterval(16)  # Ekran karesi başına bir adım
         self.auto_scroll_timer.timeout.connect(self.auto_scroll_page)
-        self.auto_scroll_speed = 50
+        self.auto_scroll_clock = QElapsedTimer()
+        self.auto_scroll_offset = 0.0  # Kesirli kaydırma konumu
+        self.auto_scroll_speed = 20  # Piksel / saniye
         self.scroll_direction = 1
 
         # Animasyon ayarları
@@ -447,14 +2584,20 @@ class ComicReader(QMainWindow):
         # Önizleme ayarları
         self.preview_size = 150
         self.preview_visible = False
-        self.preview_timer = QTimer(self)
-        self.preview_timer.timeout.connect(self.update_preview)
-        self.preview_timer.setInterval(100)
+        self.preview_cache = ImageCache(budget_mb=8)  # Ölçeklenmiş önizlemeler
+        self.preview_key = None  # Son çizilen önizleme; değişmediyse yeniden çizilmez
+        self.preview_placed_size = None
         self.preview_zoom_level = 1.0
         self.preview_zoom_step = 0.1
         self.preview_min_zoom = 0.5
         self.preview_max_zoom = 3.0
 
+        # Kütüphane yenileme işi (tek örnek, her yenilemede yeniden kullanılır)
+        self.refresh_job = LibraryRefreshJob(self.library, self)
+
+        # Önbellek ayarları
+        self.cache_budget_mb = 256  # Görüntü önbelleği için bellek bütçesi (MB)
+
         # Dil ve çeviri
         self.translator = QTranslator()
         self.current_language = self.file_manager.load_json("settings.json").get("language", "tr")
@@ -553,6 +2696,8 @@ class ComicReader(QMainWindow):
         self.continue_button_pos.addStretch()
         
         # Overlay için bir widget
+        self.page_transition = PageTransition(self.image_label)
+
         self.overlay_widget = QWidget(self.image_label)
         self.overlay_widget.setLayout(self.continue_button_pos)
         self.overlay_widget.setGeometry(self.image_label.rect())
@@ -651,7 +2796,7 @@ class ComicReader(QMainWindow):
 
         # Hız alt menüsü
         speed_menu = scroll_menu.addMenu("⏱️ Hız")
-        speeds = [("Yavaş", 100), ("Normal", 50), ("Hızlı", 20)]
+        speeds = [("Yavaş", 10), ("Normal", 20), ("Hızlı", 50)]
         for name, speed in speeds:
             action = QAction(name, self)
             action.triggered.connect(lambda checked, s=speed: self.set_auto_scroll_speed(s))
@@ -749,7 +2894,7 @@ class ComicReader(QMainWindow):
         if folder:
             self.file_manager.current_folder = folder
             files = []
-            for file in sorted(os.listdir(folder)):
+            for file in sorted(os.listdir(folder), key=natural_sort_key):
                 file_path = os.path.join(folder, file)
                 if os.path.isfile(file_path):
                     ext = os.path.splitext(file)[1].lower()
@@ -757,101 +2902,148 @@ class ComicReader(QMainWindow):
                         files.append(file_path)
             
             if files:
+                self.prefetcher.reset()
+                self.file_manager.close_page_source()
+                self.image_manager.clear_cache()
+                self.image_manager.page_source = None
                 self.pages = files
+                self.current_file = None
                 self.current_page = 0
                 self.show_page()
                 self.statusBar().showMessage(f"Klasör açıldı: {folder}")
             else:
                 QMessageBox.warning(self, "Uyarı", "Klasörde desteklenen resim dosyası bulunamadı.")
 
-    def open_specific_file(self, file_path):
-        """Belirli bir dosyayı açar"""
-        self.image_manager.clear_cache()  # Önbelleği temizle
-        temp_dir, pages = self.file_manager.open_file(file_path)
+    def open_specific_file(self, file_path, start_page=0):
+        """Belirli bir dosyayı verilen sayfadan açar"""
+        # Sayfa anahtarları arşiv yolunu içerir; önceden çözülen sayfalar için önbellek korunur
+        page_source = self.read_ahead.take(file_path)
+        self.prefetcher.reset()
+        pages = self.file_manager.open_file(file_path, page_source)
+        self.image_manager.page_source = self.file_manager.page_source
         if pages:
             self.pages = pages
-            self.current_page = 0
+            self.current_file = file_path
+            self.image_manager.set_page_info(file_path, self.page_metadata.get(file_path) or {})
+            self.current_page = min(max(0, start_page), len(pages) - 1)
+            # show_page son okunan sayfayı ve tarihi de günceller
             self.show_page()
             self.check_continue_button_visibility()
-            
-            # Son okunan tarihi güncelle
-            for series_name, series in self.library.series.items():
-                for book in series['books']:
-                    if book['path'] == file_path:
-                        book['last_read_date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        self.library.save_library()
-                        break
-
-    def show_page(self):
+
+    def on_page_metadata_ready(self, file_path, record):
+        """Açık arşivin sayfa bilgisi hazır olduğunda görüntü yöneticisine aktarır"""
+        if record and file_path == self.current_file:
+            self.image_manager.set_page_info(file_path, record['pages'])
+            if self.image_manager.double_page_mode:
+                # Yatay açılımlar artık biliniyor; eşleştirmeyi yenile
+                self.request_render()
+
+    def show_page(self, fast=False):
         """Sayfayı görüntüler"""
         if not self.pages or not (0 <= self.current_page < len(self.pages)):
             return
 
         try:
-            result = self.image_manager.show_page(self.image_label, self.pages, self.current_page)
+            result = self.image_manager.show_page(self.image_label, self.pages, self.current_page, fast)
             if result:
                 self.page_label.setText(result)
+                # Sonraki sayfaları arka planda hazırla
+                step = 2 if self.image_manager.double_page_mode else 1
+                self.prefetcher.schedule(self.pages, self.current_page, step)
+                self.read_ahead.check(self.current_file, self.pages, self.current_page + step - 1)
+                if self.preview_visible:
+                    self.update_preview()
                 # Son okunan sayfayı güncelle
-                if self.pages and self.pages[0]:
-                    self.library.update_last_read(self.pages[0], self.current_page)
+                if self.current_file:
+                    self.library.update_last_read(self.current_file, self.current_page)
         except Exception as e:
             print(f"Sayfa gösterim hatası: {e}")
 
     def zoom_in(self):
         message = self.image_manager.zoom_in()
-        self.show_page()
+        self.request_render()
         self.statusBar().showMessage(message)
 
     def zoom_out(self):
         message = self.image_manager.zoom_out()
         if message:
-            self.show_page()
+            self.request_render()
             self.statusBar().showMessage(message)
 
     def reset_zoom(self):
         message = self.image_manager.reset_zoom()
-        self.show_page()
+        self.request_render()
         self.statusBar().showMessage(message)
 
     def rotate_left(self):
         message = self.image_manager.rotate_left()
-        self.show_page()
+        self.request_render()
         self.statusBar().showMessage(message)
 
     def rotate_right(self):
         message = self.image_manager.rotate_right()
-        self.show_page()
+        self.request_render()
         self.statusBar().showMessage(message)
 
     def reset_rotation(self):
         message = self.image_manager.reset_rotation()
-        self.show_page()
+        self.request_render()
         self.statusBar().showMessage(message)
 
     def toggle_double_page(self):
         message = self.image_manager.toggle_double_page()
-        self.show_page()
+        self.request_render()
         self.statusBar().showMessage(message)
 
     def mouse_move_event(self, event):
         self.mouse_pos = event.pos()
         if self.image_manager.zoom_level > 1.0:
             label_size = self.image_label.size()
-            pixmap_size = self.image_label.pixmap().size()
+            pixmap_size = self.image_manager.zoomed_size
             self.image_manager.update_scroll_position(self.mouse_pos, label_size, pixmap_size)
-            self.show_page()
+            self.request_render(pan=True)
+
+    def request_render(self, interactive=False, pan=False):
+        """Çizim isteklerini birleştirerek kare başına en fazla bir çizim yapar"""
+        if interactive:
+            # Etkileşim sürerken hızlı önizleme, bitince tam kalite çizim
+            self.render_interactive = True
+            self.render_settle_timer.start()
+        if not pan:
+            self.render_full = True
+        if not self.render_timer.isActive():
+            self.render_timer.start()
+
+    def flush_render(self):
+        if self.render_full:
+            self.render_full = False
+            self.show_page(fast=self.render_interactive)
+        elif self.pages:
+            # Yalnızca kaydırma: önbellekteki döşemelerden görünümü yeniden birleştir
+            self.image_manager.show_page(self.image_label, self.pages, self.current_page, self.render_interactive)
+
+    def finish_interactive_render(self):
+        self.render_interactive = False
+        self.request_render()
 
     def resizeEvent(self, event):
         """Pencere boyutu değiştiğinde"""
         super().resizeEvent(event)
-        self.show_page()
+        self.request_render(interactive=True)
         if hasattr(self, 'overlay_widget') and hasattr(self, 'image_label'):
             self.overlay_widget.setGeometry(self.image_label.rect())
 
     def closeEvent(self, event):
         """Pencere kapatıldığında temizlik yapar"""
+        self.prefetcher.reset()
+        self.prefetcher.pool.waitForDone()
+        self.read_ahead.discard()
+        self.read_ahead.pool.waitForDone()
+        self.page_metadata.pool.clear()
+        self.page_metadata.pool.waitForDone()
+        self.library.close()
         self.image_manager.clear_cache()
-        self.file_manager.cleanup_temp()
+        self.file_manager.close_page_source()
         super().closeEvent(event)
 
     def keyPressEvent(self, event):
@@ -922,6 +3114,7 @@ class ComicReader(QMainWindow):
             folder = QFileDialog.getExistingDirectory(self, "Seri Klasörünü Seç")
             if folder:
                 self.library.add_series(series_name, folder)
+                self.library_watcher.sync()
                 self.statusBar().showMessage(f"Yeni seri eklendi: {series_name}")
 
     def update_series_menu(self, menu):
@@ -935,9 +3128,8 @@ class ComicReader(QMainWindow):
         if series_name in self.library.series:
             series = self.library.series[series_name]
             if series['books']:
-                self.open_specific_file(series['books'][0]['path'])
-                self.current_page = series['books'][0]['last_page']
-                self.show_page()
+                book = series['books'][0]
+                self.open_specific_file(book['path'], book.get('last_page', 0))
 
     def update_favorites_menu(self, menu):
         menu.clear()
@@ -945,19 +3137,17 @@ class ComicReader(QMainWindow):
             for book in series['books']:
                 if book.get('favorite', False):
                     action = QAction(f"{series_name} - {book['name']}", self)
-                    action.triggered.connect(lambda checked, p=book['path']: self.open_specific_file(p))
+                    action.triggered.connect(lambda checked, p=book['path']: self.open_book(p))
                     menu.addAction(action)
 
     def toggle_favorite(self):
-        if self.pages and self.pages[0]:
-            for series in self.library.series.values():
-                for book in series['books']:
-                    if book['path'] == self.pages[0]:
-                        book['favorite'] = not book.get('favorite', False)
-                        self.library.save_library()
-                        status = "favorilere eklendi" if book['favorite'] else "favorilerden çıkarıldı"
-                        self.statusBar().showMessage(f"Sayfa {status}")
-                        break
+        if self.current_file:
+            _, book = self.library.find_book(self.current_file)
+            if book is not None:
+                book['favorite'] = not book.get('favorite', False)
+                self.library.save_book(self.current_file)
+                status = "favorilere eklendi" if book['favorite'] else "favorilerden çıkarıldı"
+                self.statusBar().showMessage(f"Sayfa {status}")
 
     def toggle_auto_play(self):
         self.auto_play = not self.auto_play
@@ -978,19 +3168,6 @@ class ComicReader(QMainWindow):
         if self.auto_play:
             self.next_page()
 
-    def load_favorites(self):
-        favorites_file = "favorites.json"
-        if os.path.exists(favorites_file):
-            try:
-                with open(favorites_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return []
-        return []
-
-    def save_favorites(self):
-        self.file_manager.save_json(self.favorites, "favorites.json")
-
     def add_favorite(self):
         if not self.pages or self.current_page >= len(self.pages):
             return
@@ -1024,15 +3201,14 @@ class ComicReader(QMainWindow):
         # Favori bilgilerini kaydet
         favorite_info = {
             "filepath": filepath,
-            "source_file": self.pages[0] if self.pages else "",
+            "source_file": self.current_file or "",
             "page_number": self.current_page + 1,
             "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "title": f"Sayfa {self.current_page + 1}",
             "tags": [tag.strip() for tag in tags.split(",") if tag.strip()]
         }
 
-        self.favorites.append(favorite_info)
-        self.save_favorites()
+        self.library.add_favorite(self.favorites, favorite_info)
         self.statusBar().showMessage(f"Favori eklendi: Sayfa {self.current_page + 1}")
 
     def show_favorites(self):
@@ -1055,12 +3231,22 @@ class ComicReader(QMainWindow):
 
         # Favori listesi
         list_widget = QListWidget()
-        for fav in self.favorites:
+        list_widget.setIconSize(QSize(64, 64))
+        fav_items = {}
+
+        def add_favorite_item(fav):
             item = QListWidgetItem()
             tags_text = ", ".join(fav['tags']) if fav['tags'] else "Etiket yok"
             item.setText(f"{fav['title']} - {fav['date']} ({tags_text})")
             item.setData(Qt.UserRole, fav)
+            pixmap = self.thumbnail_service.request(fav['filepath'], size=128)
+            if pixmap:
+                item.setIcon(QIcon(pixmap))
             list_widget.addItem(item)
+            fav_items[fav['filepath']] = item
+
+        for fav in self.favorites:
+            add_favorite_item(fav)
         layout.addWidget(list_widget)
 
         # Görüntü alanı
@@ -1086,20 +3272,37 @@ class ComicReader(QMainWindow):
 
         # Etiket filtresini uygula
         def apply_filter():
-            filter_text = filter_edit.text().lower()
-            filter_tags = [tag.strip() for tag in filter_text.split(",") if tag.strip()]
+            filter_tags = [tag for tag in filter_edit.text().split(",") if SearchIndex.tokenize(tag)]
+            matches = set()
+            for tag in filter_tags:
+                matches.update(self.library.search_index.search(tag, ("favorite",)))
             
             list_widget.clear()
+            fav_items.clear()
             for fav in self.favorites:
-                if not filter_tags or any(tag in [t.lower() for t in fav['tags']] for tag in filter_tags):
-                    item = QListWidgetItem()
-                    tags_text = ", ".join(fav['tags']) if fav['tags'] else "Etiket yok"
-                    item.setText(f"{fav['title']} - {fav['date']} ({tags_text})")
-                    item.setData(Qt.UserRole, fav)
-                    list_widget.addItem(item)
+                if not filter_tags or ("favorite", fav['filepath']) in matches:
+                    add_favorite_item(fav)
 
         filter_edit.textChanged.connect(apply_filter)
 
+        # Küçük resim hazır olduğunda simgeyi ve önizlemeyi güncelle
+        def thumbnail_ready(key, image):
+            file_path, page, size = key[:3]
+            item = fav_items.get(file_path)
+            if item is None:
+                return
+            if size == 128:
+                pixmap = self.thumbnail_service.request(file_path, size=128)
+                if pixmap:
+                    item.setIcon(QIcon(pixmap))
+            elif size == 512 and list_widget.currentItem() is item:
+                self.update_favorite_preview(item, image_label)
+
+        self.thumbnail_service.thumbnail_ready.connect(thumbnail_ready)
+        dialog.finished.connect(
+            lambda result: self.thumbnail_service.thumbnail_ready.disconnect(thumbnail_ready)
+        )
+
         # Seçim değiştiğinde görüntüyü güncelle
         list_widget.currentItemChanged.connect(
             lambda current, previous: self.update_favorite_preview(current, image_label)
@@ -1110,8 +3313,8 @@ class ComicReader(QMainWindow):
     def update_favorite_preview(self, item, image_label):
         if item:
             fav = item.data(Qt.UserRole)
-            pixmap = QPixmap(fav['filepath'])
-            if not pixmap.isNull():
+            pixmap = self.thumbnail_service.request(fav['filepath'], size=512)
+            if pixmap:
                 image_label.setPixmap(pixmap.scaled(
                     image_label.size(),
                     Qt.KeepAspectRatio,
@@ -1124,8 +3327,7 @@ class ComicReader(QMainWindow):
             fav = current_item.data(Qt.UserRole)
             try:
                 os.remove(fav['filepath'])
-                self.favorites.remove(fav)
-                self.save_favorites()
+                self.library.remove_favorite(self.favorites, fav)
                 list_widget.takeItem(list_widget.row(current_item))
                 image_label.clear()
                 self.statusBar().showMessage("Favori silindi")
@@ -1137,15 +3339,15 @@ class ComicReader(QMainWindow):
         if current_item:
             fav = current_item.data(Qt.UserRole)
             if os.path.exists(fav['source_file']):
-                self.open_specific_file(fav['source_file'])
-                self.current_page = fav['page_number'] - 1
-                self.show_page()
+                self.open_specific_file(fav['source_file'], fav['page_number'] - 1)
                 self.statusBar().showMessage(f"Favori sayfasına gidildi: Sayfa {fav['page_number']}")
 
     def toggle_auto_scroll(self):
         self.auto_scroll = not self.auto_scroll
         if self.auto_scroll:
-            self.auto_scroll_timer.start(self.auto_scroll_speed)
+            self.auto_scroll_offset = float(self.image_manager.scroll_pos.y())
+            self.auto_scroll_clock.start()
+            self.auto_scroll_timer.start()
             self.statusBar().showMessage("Otomatik kaydırma başladı")
         else:
             self.auto_scroll_timer.stop()
@@ -1153,38 +3355,43 @@ class ComicReader(QMainWindow):
 
     def set_auto_scroll_speed(self, speed):
         self.auto_scroll_speed = speed
-        if self.auto_scroll:
-            self.auto_scroll_timer.setInterval(speed)
-        self.statusBar().showMessage(f"Kaydırma hızı: {speed}ms")
+        self.statusBar().showMessage(f"Kaydırma hızı: {speed} piksel/sn")
 
     def set_scroll_direction(self, direction):
         self.scroll_direction = direction
         self.statusBar().showMessage(f"Kaydırma yönü: {'Yukarı' if direction == -1 else 'Aşağı'}")
 
     def auto_scroll_page(self):
-        if self.auto_scroll and self.image_manager.zoom_level > 1.0:
-            pixmap = self.image_label.pixmap()
-            if pixmap and not pixmap.isNull():
-                label_size = self.image_label.size()
-                pixmap_size = pixmap.size()
-                
-                if self.scroll_direction == 1:  # Aşağı
-                    if self.image_manager.scroll_pos.y() + label_size.height() < pixmap_size.height():
-                        self.image_manager.scroll_pos.setY(self.image_manager.scroll_pos.y() + 1)
-                    else:
-                        self.next_page()
-                        self.image_manager.scroll_pos.setY(0)
-                else:  # Yukarı
-                    if self.image_manager.scroll_pos.y() > 0:
-                        self.image_manager.scroll_pos.setY(self.image_manager.scroll_pos.y() - 1)
-                    else:
-                        self.prev_page()
-                        if self.pages and self.current_page < len(self.pages):
-                            pixmap = QPixmap(self.pages[self.current_page])
-                            if not pixmap.isNull():
-                                self.image_manager.scroll_pos.setY(pixmap.height() - label_size.height())
-                
-                self.show_page()
+        """Geçen süreye göre kaydırır; yalnızca görünen döşemeler yeniden birleştirilir"""
+        elapsed = self.auto_scroll_clock.restart() / 1000.0
+        if not self.auto_scroll or not self.pages or self.image_manager.zoom_level <= 1.0:
+            return
+
+        scroll_y = self.image_manager.scroll_pos.y()
+        # Fare ile kaydırıldıysa konumu yeniden eşitle
+        if int(self.auto_scroll_offset) != scroll_y:
+            self.auto_scroll_offset = float(scroll_y)
+        max_y = max(0, self.image_manager.zoomed_size.height() - self.image_label.height())
+        self.auto_scroll_offset += self.scroll_direction * self.auto_scroll_speed * elapsed
+
+        if self.auto_scroll_offset > max_y or self.auto_scroll_offset < 0:
+            position = (self.current_file, self.current_page)
+            if self.scroll_direction == 1:  # Aşağı: sonraki sayfanın başına
+                self.image_manager.scroll_pos.setY(0)
+                self.next_page()
+            else:  # Yukarı: önceki sayfanın sonuna (çizimde sınıra çekilir)
+                self.image_manager.scroll_pos.setY(self.image_manager.zoomed_size.height())
+                self.prev_page()
+            if (self.current_file, self.current_page) == position:
+                # Kitabın sonuna veya başına gelindi
+                self.image_manager.scroll_pos.setY(scroll_y)
+                self.toggle_auto_scroll()
+            self.auto_scroll_offset = float(self.image_manager.scroll_pos.y())
+            return
+
+        if int(self.auto_scroll_offset) != scroll_y:
+            self.image_manager.scroll_pos.setY(int(self.auto_scroll_offset))
+            self.image_manager.show_page(self.image_label, self.pages, self.current_page)
 
     def set_animation_type(self, anim_type):
         self.animation_type = anim_type
@@ -1199,151 +3406,33 @@ class ComicReader(QMainWindow):
         self.statusBar().showMessage(f"Animasyon hızı: {speed}ms")
 
     def animate_page_transition(self, next_page_func):
-        if self.animation_type == "slide":
-            self.animate_slide(next_page_func)
-        elif self.animation_type == "fade":
-            self.animate_fade(next_page_func)
-        elif self.animation_type == "zoom":
-            self.animate_zoom(next_page_func)
-
-    def animate_slide(self, next_page_func):
-        current_pixmap = self.image_label.pixmap()
-        if not current_pixmap:
-            next_page_func()
+        """Geçişi tek katmanda oynatır; süren geçiş varsa keser ve sayfayı doğrudan gösterir"""
+        if self.page_transition.is_running() or self.render_timer.isActive():
+            # Hızlı çevirmede animasyonlar birikmez, çizimler kare başına birleştirilir
+            self.page_transition.stop()
+            self.request_render()
             return
 
-        # Yeni sayfayı yükle
+        outgoing = self.image_manager.current_pixmap
         next_page_func()
-        next_pixmap = self.image_label.pixmap()
-        if not next_pixmap:
-            return
-
-        # Animasyon için geçici etiketler
-        current_label = QLabel(self)
-        current_label.setPixmap(current_pixmap)
-        current_label.setGeometry(self.image_label.geometry())
-        current_label.show()
-
-        next_label = QLabel(self)
-        next_label.setPixmap(next_pixmap)
-        next_label.setGeometry(self.image_label.geometry())
-        next_label.show()
-
-        # Animasyon başlangıç ve bitiş pozisyonları
-        start_pos = QPoint(0, 0)
-        end_pos = QPoint(0, 0)
-        
-        if self.animation_direction == "right":
-            start_pos = QPoint(0, 0)
-            end_pos = QPoint(-self.image_label.width(), 0)
-        elif self.animation_direction == "left":
-            start_pos = QPoint(0, 0)
-            end_pos = QPoint(self.image_label.width(), 0)
-        elif self.animation_direction == "up":
-            start_pos = QPoint(0, 0)
-            end_pos = QPoint(0, self.image_label.height())
-        elif self.animation_direction == "down":
-            start_pos = QPoint(0, 0)
-            end_pos = QPoint(0, -self.image_label.height())
-
-        # Animasyon
-        anim = QPropertyAnimation(current_label, b"pos")
-        anim.setDuration(self.animation_duration)
-        anim.setStartValue(start_pos)
-        anim.setEndValue(end_pos)
-        anim.start()
-
-        # Animasyon bitince temizle
-        anim.finished.connect(lambda: self.cleanup_animation(current_label, next_label))
-
-    def animate_fade(self, next_page_func):
-        current_pixmap = self.image_label.pixmap()
-        if not current_pixmap:
-            next_page_func()
-            return
-
-        # Yeni sayfayı yükle
-        next_page_func()
-        next_pixmap = self.image_label.pixmap()
-        if not next_pixmap:
-            return
-
-        # Animasyon için geçici etiketler
-        current_label = QLabel(self)
-        current_label.setPixmap(current_pixmap)
-        current_label.setGeometry(self.image_label.geometry())
-        current_label.show()
-
-        next_label = QLabel(self)
-        next_label.setPixmap(next_pixmap)
-        next_label.setGeometry(self.image_label.geometry())
-        next_label.show()
-
-        # Animasyon
-        anim = QPropertyAnimation(current_label, b"windowOpacity")
-        anim.setDuration(self.animation_duration)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.0)
-        anim.start()
-
-        # Animasyon bitince temizle
-        anim.finished.connect(lambda: self.cleanup_animation(current_label, next_label))
-
-    def animate_zoom(self, next_page_func):
-        current_pixmap = self.image_label.pixmap()
-        if not current_pixmap:
-            next_page_func()
-            return
-
-        # Yeni sayfayı yükle
-        next_page_func()
-        next_pixmap = self.image_label.pixmap()
-        if not next_pixmap:
-            return
-
-        # Animasyon için geçici etiketler
-        current_label = QLabel(self)
-        current_label.setPixmap(current_pixmap)
-        current_label.setGeometry(self.image_label.geometry())
-        current_label.show()
-
-        next_label = QLabel(self)
-        next_label.setPixmap(next_pixmap)
-        next_label.setGeometry(self.image_label.geometry())
-        next_label.show()
-
-        # Animasyon
-        anim = QPropertyAnimation(current_label, b"geometry")
-        anim.setDuration(self.animation_duration)
-        anim.setStartValue(self.image_label.geometry())
-        anim.setEndValue(QRect(
-            self.image_label.x() + self.image_label.width()/4,
-            self.image_label.y() + self.image_label.height()/4,
-            self.image_label.width()/2,
-            self.image_label.height()/2
-        ))
-        anim.start()
-
-        # Animasyon bitince temizle
-        anim.finished.connect(lambda: self.cleanup_animation(current_label, next_label))
-
-    def cleanup_animation(self, current_label, next_label):
-        current_label.deleteLater()
-        next_label.deleteLater()
-        self.show_page()
+        if outgoing and self.image_manager.current_pixmap is not outgoing:
+            self.page_transition.start(outgoing, self.animation_type, self.animation_direction, self.animation_duration)
 
     def toggle_preview(self):
         self.preview_visible = not self.preview_visible
         if self.preview_visible:
             self.preview_zoom_level = 1.0  # Yakınlaştırmayı sıfırla
-            self.preview_timer.start()
+            self.update_preview()
             self.statusBar().showMessage("Sayfa önizleme açık")
         else:
-            self.preview_timer.stop()
+            if hasattr(self, 'preview_window'):
+                self.preview_window.hide()
+            self.preview_key = None
             self.statusBar().showMessage("Sayfa önizleme kapalı")
 
     def set_preview_size(self, size):
         self.preview_size = size
+        self.update_preview()
         self.statusBar().showMessage(f"Önizleme boyutu: {size}px")
 
     def update_preview(self):
@@ -1421,33 +3510,43 @@ class ComicReader(QMainWindow):
             self.preview_dragging = False
             self.preview_drag_position = QPoint()
 
-        # Önizleme penceresini konumlandır
-        if not self.preview_dragging:
+        # Önizleme penceresini yalnızca boyut değiştiğinde konumlandır
+        if not self.preview_dragging and self.preview_placed_size != self.preview_size:
             screen_geometry = QApplication.desktop().screenGeometry()
             preview_x = screen_geometry.width() - self.preview_size - 20
             preview_y = 20
             self.preview_window.setGeometry(preview_x, preview_y, self.preview_size, self.preview_size + 90)
+            self.preview_placed_size = self.preview_size
 
-        # Önizleme görüntüsünü yükle
+        # Önizleme görüntüsünü paylaşılan önbellekten yükle
         if 0 <= self.current_page < len(self.pages):
-            pixmap = QPixmap(self.pages[self.current_page])
-            if not pixmap.isNull():
-                scaled_size = QSize(
-                    int(self.preview_size * self.preview_zoom_level),
-                    int(self.preview_size * self.preview_zoom_level)
-                )
-                scaled = pixmap.scaled(
-                    scaled_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
+            page_path = self.pages[self.current_page]
+            preview_side = int(self.preview_size * self.preview_zoom_level)
+            key = (page_path, preview_side)
+            if key == self.preview_key and self.preview_window.isVisible():
+                return
+
+            scaled = self.preview_cache.get(key)
+            if scaled is None:
+                pixmap = self.image_manager.get_cached_image(page_path)
+                if pixmap:
+                    scaled = pixmap.scaled(
+                        QSize(preview_side, preview_side),
+                        Qt.KeepAspectRatio,
+                        Qt.SmoothTransformation
+                    )
+                    self.preview_cache.put(key, scaled)
+            if scaled:
+                self.preview_key = key
                 self.preview_label.setPixmap(scaled)
                 self.preview_page_label.setText(f"Sayfa {self.current_page + 1}/{len(self.pages)}")
                 self.preview_zoom_label.setText(f"{int(self.preview_zoom_level * 100)}%")
                 self.preview_window.show()
             else:
+                self.preview_key = None
                 self.preview_window.hide()
         else:
+            self.preview_key = None
             self.preview_window.hide()
 
     def preview_mouse_press(self, event):
@@ -1575,11 +3674,15 @@ class ComicReader(QMainWindow):
         if settings:
             self.theme_manager.current_theme = settings.get("theme", "dark")
             self.theme_manager.apply_theme(self)
+            self.cache_budget_mb = settings.get("cache_budget_mb", self.cache_budget_mb)
+            self.image_manager.image_cache.set_budget(self.cache_budget_mb)
 
     def save_settings(self):
         settings = {
             "theme": self.theme_manager.current_theme,
-            "language": self.current_language
+            "language": self.current_language,
+            "cache_budget_mb": self.cache_budget_mb,
+            "library_backend": self.library_backend
         }
         self.file_manager.save_json(settings, "settings.json")
 
@@ -1623,16 +3726,12 @@ class ComicReader(QMainWindow):
                 note = {
                     "title": title,
                     "content": content,
-                    "source_file": self.pages[0] if self.pages else "",
+                    "source_file": self.current_file or "",
                     "page_number": self.current_page + 1,
                     "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
                 
-                if "notes" not in self.notes:
-                    self.notes["notes"] = []
-                
-                self.notes["notes"].append(note)
-                self.file_manager.save_json(self.notes, "notes.json")
+                self.library.add_note(self.notes, note)
                 self.statusBar().showMessage(f"Not eklendi: {title}")
                 dialog.accept()
             else:
@@ -1650,14 +3749,28 @@ class ComicReader(QMainWindow):
         
         layout = QVBoxLayout()
         
+        # Arama kutusu
+        search_edit = QLineEdit()
+        search_edit.setPlaceholderText("Notlarda ara...")
+        layout.addWidget(search_edit)
+        
         # Not listesi
         list_widget = QListWidget()
-        if "notes" in self.notes:
-            for note in self.notes["notes"]:
+        
+        def fill_notes(text=""):
+            list_widget.clear()
+            filtering = bool(SearchIndex.tokenize(text))
+            matches = self.library.search_index.search(text, ("note",))
+            for note in self.notes.get("notes", []):
+                if filtering and ("note", note['id']) not in matches:
+                    continue
                 item = QListWidgetItem()
                 item.setText(f"{note['title']} - Sayfa {note['page_number']} ({note['date']})")
                 item.setData(Qt.UserRole, note)
                 list_widget.addItem(item)
+        
+        fill_notes()
+        search_edit.textChanged.connect(fill_notes)
         layout.addWidget(list_widget)
         
         # Not içeriği
@@ -1691,8 +3804,7 @@ class ComicReader(QMainWindow):
             if current_item:
                 note = current_item.data(Qt.UserRole)
                 if "notes" in self.notes:
-                    self.notes["notes"].remove(note)
-                    self.file_manager.save_json(self.notes, "notes.json")
+                    self.library.remove_note(self.notes, note)
                     list_widget.takeItem(list_widget.row(current_item))
                     content_text.clear()
                     self.statusBar().showMessage("Not silindi")
@@ -1733,7 +3845,8 @@ class ComicReader(QMainWindow):
                     note["content"] = content_input.toPlainText()
                     note["date"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     
-                    self.file_manager.save_json(self.notes, "notes.json")
+                    self.library.update_note(self.notes, note)
+                    current_item.setData(Qt.UserRole, note)
                     current_item.setText(f"{note['title']} - Sayfa {note['page_number']} ({note['date']})")
                     show_note_content(current_item)
                     self.statusBar().showMessage("Not düzenlendi")
@@ -1749,9 +3862,7 @@ class ComicReader(QMainWindow):
             if current_item:
                 note = current_item.data(Qt.UserRole)
                 if os.path.exists(note["source_file"]):
-                    self.open_specific_file(note["source_file"])
-                    self.current_page = note["page_number"] - 1
-                    self.show_page()
+                    self.open_specific_file(note["source_file"], note["page_number"] - 1)
                     self.statusBar().showMessage(f"Not sayfasına gidildi: Sayfa {note['page_number']}")
                     dialog.accept()
         
@@ -1765,7 +3876,7 @@ class ComicReader(QMainWindow):
     def prev_page(self):
         if self.pages:
             if self.current_page > 0:
-                self.current_page -= 2 if self.image_manager.double_page_mode else 1
+                self.current_page -= self.image_manager.previous_step(self.pages, self.current_page)
                 self.current_page = max(0, self.current_page)
                 self.animate_page_transition(self.show_page)
             else:
@@ -1774,18 +3885,18 @@ class ComicReader(QMainWindow):
     def next_page(self):
         if self.pages:
             if self.current_page < len(self.pages) - 1:
-                step = 2 if self.image_manager.double_page_mode else 1
+                step = self.image_manager.page_step(self.pages, self.current_page)
                 if self.current_page + step < len(self.pages):
                     self.current_page += step
                     self.animate_page_transition(self.show_page)
                 else:
-                    next_file = self.file_manager.get_next_file_in_directory(self.pages[0])
+                    next_file = self.file_manager.get_next_file_in_directory(self.current_file)
                     if next_file:
                         self.open_specific_file(next_file)
                     else:
                         self.statusBar().showMessage("Son sayfadasınız")
             else:
-                next_file = self.file_manager.get_next_file_in_directory(self.pages[0])
+                next_file = self.file_manager.get_next_file_in_directory(self.current_file)
                 if next_file:
                     self.open_specific_file(next_file)
                 else:
@@ -1823,15 +3934,22 @@ class ComicReader(QMainWindow):
         splitter = QSplitter(Qt.Horizontal)
         
         # Seri listesi
-        series_list = QListWidget()
+        series_model = SeriesListModel(self.library, dialog)
+        series_proxy = LibraryFilterProxyModel(self.library, dialog)
+        series_proxy.setSourceModel(series_model)
+        series_list = QListView()
         series_list.setMinimumWidth(200)
-        for series_name in self.library.series:
-            series_list.addItem(series_name)
+        series_list.setUniformItemSizes(True)
+        series_list.setModel(series_proxy)
         splitter.addWidget(series_list)
         
         # Kitap listesi
-        book_list = QListWidget()
+        book_model = BookListModel(self.library, self.thumbnail_service, dialog)
+        book_list = QListView()
         book_list.setMinimumWidth(400)
+        book_list.setUniformItemSizes(True)
+        book_list.setLayoutMode(QListView.Batched)
+        book_list.setModel(book_model)
         splitter.addWidget(book_list)
         
         layout.addWidget(splitter)
@@ -1854,90 +3972,123 @@ class ComicReader(QMainWindow):
         button_layout.addWidget(add_series_button)
         
         refresh_button = QPushButton("Yenile")
-        refresh_button.clicked.connect(lambda: self.refresh_library(series_list, book_list))
+        refresh_button.clicked.connect(
+            lambda: self.refresh_library(progress_bar, refresh_button, library_changed)
+        )
         button_layout.addWidget(refresh_button)
         
         layout.addLayout(button_layout)
+
+        # Yenileme ilerlemesi
+        progress_bar = QProgressBar()
+        progress_bar.hide()
+        layout.addWidget(progress_bar)
+        dialog.finished.connect(lambda result: self.refresh_job.cancel())
         
+        # Kapak küçük resimleri
+        book_list.setIconSize(QSize(48, 72))
+        self.thumbnail_service.thumbnail_ready.connect(book_model.on_thumbnail_ready)
+
+        # Kütüphane dışarıdan değiştiğinde modelleri yenile
+        def library_changed():
+            series_model.refresh()
+            book_model.refresh()
+            series_proxy.set_filter_text(search_edit.text())
+
+        self.library_watcher.library_changed.connect(library_changed)
+
+        def disconnect_models(result):
+            self.thumbnail_service.thumbnail_ready.disconnect(book_model.on_thumbnail_ready)
+            self.library_watcher.library_changed.disconnect(library_changed)
+
+        dialog.finished.connect(disconnect_models)
+
         # Seri seçildiğinde kitapları güncelle
         def update_books():
-            current_series = series_list.currentItem()
-            if current_series:
-                series_name = current_series.text()
-                book_list.clear()
-                if series_name in self.library.series:
-                    for book in self.library.series[series_name]['books']:
-                        item = QListWidgetItem(book['name'])
-                        item.setData(Qt.UserRole, book['path'])
-                        book_list.addItem(item)
-        
-        series_list.currentItemChanged.connect(update_books)
+            current_series = series_list.currentIndex()
+            if current_series.isValid():
+                self.thumbnail_service.cancel_pending()
+                book_model.set_series(current_series.data(Qt.UserRole))
+        
+        series_list.selectionModel().currentChanged.connect(update_books)
         
         # Kitap seçildiğinde bilgileri güncelle
         def update_info():
-            current_book = book_list.currentItem()
-            if current_book:
+            current_book = book_list.currentIndex()
+            if current_book.isValid():
                 book_path = current_book.data(Qt.UserRole)
-                for series in self.library.series.values():
-                    for book in series['books']:
-                        if book['path'] == book_path:
-                            info = f"""
-                            <b>Kitap:</b> {book['name']}<br>
-                            <b>Son Okunan Sayfa:</b> {book['last_page'] + 1}<br>
-                            <b>Favori:</b> {'Evet' if book.get('favorite', False) else 'Hayır'}<br>
-                            <b>Konum:</b> {book_path}
-                            """
-                            info_label.setText(info)
-                            break
-        
-        book_list.currentItemChanged.connect(update_info)
-        
-        # Arama fonksiyonu
-        def search_items(text):
-            text = text.lower()
-            series_list.clear()
-            for series_name in self.library.series:
-                if text in series_name.lower():
-                    series_list.addItem(series_name)
-                else:
-                    # Seri içindeki kitapları kontrol et
-                    for book in self.library.series[series_name]['books']:
-                        if text in book['name'].lower():
-                            series_list.addItem(series_name)
-                            break
+                _, book = self.library.find_book(book_path)
+                if book is not None:
+                    info = f"""
+                    <b>Kitap:</b> {book['name']}<br>
+                    <b>Son Okunan Sayfa:</b> {book['last_page'] + 1}<br>
+                    <b>Favori:</b> {'Evet' if book.get('favorite', False) else 'Hayır'}<br>
+                    <b>Konum:</b> {book_path}
+                    """
+                    info_label.setText(info)
         
-        search_edit.textChanged.connect(search_items)
+        book_list.selectionModel().currentChanged.connect(update_info)
+        
+        # Arama fonksiyonu; yazarken her tuşta süzmemek için kısa gecikme
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(150)
+        search_timer.timeout.connect(lambda: series_proxy.set_filter_text(search_edit.text()))
+        search_edit.textChanged.connect(search_timer.start)
         
         dialog.exec_()
     
     def open_selected_book(self, book_list, dialog):
-        current_item = book_list.currentItem()
-        if current_item:
-            book_path = current_item.data(Qt.UserRole)
-            self.open_specific_file(book_path)
+        current_index = book_list.currentIndex()
+        if current_index.isValid():
+            book_path = current_index.data(Qt.UserRole)
+            self.open_book(book_path)
             dialog.accept()
+
+    def open_book(self, book_path):
+        """Kütüphanedeki kitabı kayıtlı son sayfasından açar"""
+        _, book = self.library.find_book(book_path)
+        self.open_specific_file(book_path, book.get('last_page', 0) if book else 0)
     
-    def refresh_library(self, series_list, book_list):
-        for series_name in self.library.series:
-            self.library.update_series_books(series_name)
-        current_series = series_list.currentItem()
-        if current_series:
-            series_name = current_series.text()
-            book_list.clear()
-            if series_name in self.library.series:
-                for book in self.library.series[series_name]['books']:
-                    item = QListWidgetItem(book['name'])
-                    item.setData(Qt.UserRole, book['path'])
-                    book_list.addItem(item)
+    def refresh_library(self, progress_bar, refresh_button, on_finished):
+        """Serileri arka planda yeniden tarar; çalışırken tekrar basılırsa iptal eder"""
+        if self.refresh_job.running:
+            self.refresh_job.cancel()
+            return
+
+        progress_bar.setValue(0)
+        progress_bar.setMaximum(max(1, len(self.library.series)))
+        progress_bar.show()
+        refresh_button.setText("İptal")
+
+        def update_progress(done, total, series_name):
+            progress_bar.setMaximum(total)
+            progress_bar.setValue(done)
+            progress_bar.setFormat(f"{series_name} ({done}/{total})")
+
+        def refresh_finished(cancelled):
+            # İş pencere boyunca yeniden kullanılır; bu yenilemenin bağlantıları kaldırılır
+            self.refresh_job.progress.disconnect(update_progress)
+            self.refresh_job.finished.disconnect(refresh_finished)
+            progress_bar.hide()
+            refresh_button.setText("Yenile")
+            if cancelled:
+                self.statusBar().showMessage("Kütüphane yenileme iptal edildi")
+                return
+            self.statusBar().showMessage("Kütüphane yenilendi")
+            self.library_watcher.sync()
+            on_finished()
+
+        self.refresh_job.progress.connect(update_progress)
+        self.refresh_job.finished.connect(refresh_finished)
+        self.refresh_job.start()
 
     def continue_last_reading(self):
         """Son okunan çizgi romanı açar"""
         last_file, last_page = self.library.get_last_read()
         
         if last_file and os.path.exists(last_file):
-            self.open_specific_file(last_file)
-            self.current_page = last_page
-            self.show_page()
+            self.open_specific_file(last_file, last_page)
             self.overlay_widget.hide()
             self.statusBar().showMessage(f"Son okunan sayfadan devam ediliyor: Sayfa {last_page + 1}")
         else:
@@ -0,0 +1,76 @@
+import os
+import struct
+import zlib
+
+import pytest
+
+pytest.importorskip("rarfile")
+pytest.importorskip("PyQt5.QtWidgets")
+pytest.importorskip("PIL")
+
+from comic_reader import RarPageSource
+
+
+def _header(head_type, flags, body):
+    """RAR 1.5-4.x blok başlığı; CRC, HEAD_TYPE'tan itibaren hesaplanır"""
+    size = 7 + len(body)
+    data = struct.pack("<BHH", head_type, flags, size) + body
+    return struct.pack("<H", zlib.crc32(data) & 0xFFFF) + data
+
+
+def make_cbr(path, members, solid=False):
+    """Sıkıştırmasız (store) üyelerden oluşan bir RAR4 arşivi yazar"""
+    out = b"Rar!\x1a\x07\x00"
+    out += _header(0x73, 0x0008 if solid else 0, b"\x00" * 6)
+    for index, (name, data) in enumerate(members):
+        encoded = name.encode("ascii")
+        flags = 0x8000  # LONG_BLOCK: başlığın ardından veri gelir
+        if solid and index > 0:
+            flags |= 0x0010  # RAR_FILE_SOLID
+        body = struct.pack(
+            "<IIBIIBBHI", len(data), len(data), 3, zlib.crc32(data), 0x5A210000, 29, 0x30,
+            len(encoded), 0o100644,
+        ) + encoded
+        out += _header(0x74, flags, body) + data
+    out += _header(0x7B, 0x4000, b"")
+    path.write_bytes(out)
+    return path
+
+
+@pytest.fixture
+def pages():
+    return [("page10.jpg", b"ten" * 50), ("page2.jpg", b"two" * 50), ("notes.txt", b"skip")]
+
+
+def test_opens_cbr_and_reads_pages(tmp_path, pages):
+    cbr = make_cbr(tmp_path / "issue.cbr", pages)
+    source = RarPageSource(str(cbr))
+    try:
+        assert not source.solid
+        assert [os.path.basename(page) for page in source.pages] == ["page2.jpg", "page10.jpg"]
+        assert source.read_page(source.pages[0]) == b"two" * 50
+        assert source.read_page(source.pages[1]) == b"ten" * 50
+    finally:
+        source.close()
+
+
+def test_detects_solid_cbr_from_entry_flags(tmp_path, pages):
+    cbr = make_cbr(tmp_path / "solid.cbr", pages, solid=True)
+    source = RarPageSource(str(cbr))
+    try:
+        assert source.solid
+        # UnRAR akışı açılamazsa üye doğrudan arşivden okunur
+        assert source.read_page(source.pages[1]) == b"ten" * 50
+    finally:
+        source.close()
+
+
+def test_close_does_not_wait_for_reader(tmp_path, pages):
+    cbr = make_cbr(tmp_path / "solid.cbr", pages, solid=True)
+    source = RarPageSource(str(cbr))
+    source.lock.acquire()  # Akışı okuyan bir iş parçacığını taklit eder
+    try:
+        source.close()
+    finally:
+        source.lock.release()
+    assert source.read_page(source.pages[0]) is None